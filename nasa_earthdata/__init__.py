@@ -5,7 +5,22 @@ A plugin for searching, visualizing, and downloading NASA Earthdata products in
 Supports Cloud Optimized GeoTIFF (COG) visualization and data footprint display.
 """
 
-from .nasa_earthdata import NASAEarthdata
+
+def __getattr__(name):
+    """Lazily expose ``NASAEarthdata`` without importing it at package import.
+
+    Args:
+        name: Attribute name requested from the package.
+
+    Returns:
+        The NASAEarthdata class when ``name`` is ``"NASAEarthdata"``.
+    """
+    if name == "NASAEarthdata":
+        from .nasa_earthdata import NASAEarthdata
+
+        globals()["NASAEarthdata"] = NASAEarthdata
+        return NASAEarthdata
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def classFactory(iface):
@@ -17,4 +32,6 @@ def classFactory(iface):
     Returns:
         NASAEarthdata: The plugin instance.
     """
+    from .nasa_earthdata import NASAEarthdata
+
     return NASAEarthdata(iface)
@@ -0,0 +1,3 @@
+"""Plugin version, kept in sync with ``version=`` in metadata.txt."""
+
+__version__ = "0.9.1"
@@ -7,7 +7,7 @@ target, so an https URL that 301s to http is still refused.
 """
 
 import urllib.request
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 
 def require_https(url: str) -> None:
@@ -37,19 +37,23 @@ def _build_opener() -> urllib.request.OpenerDirector:
     return urllib.request.build_opener(_HttpsOnlyRedirectHandler())
 
 
-def https_only_urlopen(url: str, timeout: float = 30):
+def https_only_urlopen(
+    url: str, timeout: float = 30, headers: Optional[Dict[str, str]] = None
+):
     """``urlopen`` wrapper that rejects non-https URLs and redirects.
 
     Args:
         url: The URL to open. Must use the ``https`` scheme.
         timeout: Socket timeout in seconds.
+        headers: Optional extra request headers.
 
     Returns:
         A response object compatible with ``urllib.request.urlopen``.
     """
     require_https(url)
     opener = _build_opener()
-    return opener.open(url, timeout=timeout)  # nosec B310
+    request = urllib.request.Request(url, headers=headers or {})
+    return opener.open(request, timeout=timeout)  # nosec B310
 
 
 def https_only_urlretrieve(
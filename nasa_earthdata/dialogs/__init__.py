@@ -7,11 +7,12 @@ This module contains the dialog and dock widget classes for the NASA Earthdata p
 from .earthdata_dock import EarthdataDockWidget
 from .settings_dock import SettingsDockWidget
 from .update_checker import UpdateCheckerDialog
-from .deps_manager import DepsInstallWorker
+from .deps_manager import DepsCheckWorker, DepsInstallWorker
 
 __all__ = [
     "EarthdataDockWidget",
     "SettingsDockWidget",
     "UpdateCheckerDialog",
+    "DepsCheckWorker",
     "DepsInstallWorker",
 ]
@@ -1,9 +1,10 @@
 """
 Dependency Installation Worker for NASA Earthdata Plugin.
 
-Provides a QThread-based worker that runs the full dependency
-installation (Python download + venv creation + pip install) in
-the background to avoid freezing the QGIS UI.
+Provides QThread-based workers that run the full dependency
+installation (Python download + venv creation + pip install) and the
+installed-package status check in the background to avoid freezing
+the QGIS UI.
 """
 
 from qgis.PyQt.QtCore import QThread, pyqtSignal
@@ -51,3 +52,29 @@ class DepsInstallWorker(QThread):
 
             error_msg = f"{str(e)}\n{traceback.format_exc()}"
             self.finished.emit(False, error_msg)
+
+
+class DepsCheckWorker(QThread):
+    """Worker thread that checks which plugin dependencies are installed.
+
+    Signals:
+        result: Emitted with (all_ok: bool, missing: list, installed: list),
+            matching the return value of ``check_dependencies``.
+        failed: Emitted with the error message instead of ``result`` when
+            the check itself fails, so an internal error is not reported
+            as missing packages.
+    """
+
+    result = pyqtSignal(bool, list, list)
+    failed = pyqtSignal(str)
+
+    def run(self):
+        """Run the dependency status check."""
+        try:
+            from ..core.venv_manager import check_dependencies
+
+            all_ok, missing, installed = check_dependencies()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.result.emit(all_ok, list(missing), list(installed))
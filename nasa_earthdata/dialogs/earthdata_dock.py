@@ -15,7 +15,8 @@ import time
 import uuid
 import webbrowser
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePath
+from urllib.parse import urlparse
 
 from qgis.PyQt.QtCore import (
     Qt,
@@ -50,7 +51,6 @@ from qgis.PyQt.QtWidgets import (
     QTableWidgetItem,
     QHeaderView,
     QAbstractItemView,
-    QApplication,
     QScrollArea,
     QSizePolicy,
     QListWidget,
@@ -114,6 +114,9 @@ CACHE_DIR = Path(tempfile.gettempdir()) / "nasa_earthdata_cache"
 CATALOG_CACHE_FILE = CACHE_DIR / "nasa_earth_data.tsv"
 CATALOG_CACHE_MAX_AGE_DAYS = 7
 
+# Downloaded file extensions offered for loading as raster layers
+RASTER_FILE_EXTENSIONS = frozenset({".tif", ".tiff", ".nc", ".hdf"})
+
 
 class NumericTableWidgetItem(QTableWidgetItem):
     """Custom QTableWidgetItem that sorts numerically using UserRole data."""
@@ -309,6 +312,8 @@ class CatalogLoadWorker(QThread):
                 self.progress.emit("Downloading NASA Earthdata catalog...")
                 with https_only_urlopen(self.catalog_url, timeout=30) as resp:
                     text = resp.read().decode("utf-8")
+                if self.isInterruptionRequested():
+                    return
                 # Save raw TSV to cache
                 if self.cache_enabled:
                     with open(cache_file, "w", encoding="utf-8") as f:
@@ -316,6 +321,8 @@ class CatalogLoadWorker(QThread):
                 reader = csv.DictReader(text.splitlines(), delimiter="\t")
                 rows = list(reader)
 
+            if self.isInterruptionRequested():
+                return
             catalog = CatalogData(rows)
             self.finished.emit(catalog, catalog.get_dataset_items())
 
@@ -427,11 +434,15 @@ class DataSearchWorker(QThread):
             from ..core.venv_manager import import_earthaccess
 
             earthaccess = import_earthaccess()
+            if self.isInterruptionRequested():
+                return
 
             self.progress.emit("Searching NASA Earthdata...")
             kwargs = self._build_search_kwargs()
 
             granules = earthaccess.search_data(count=self.max_items, **kwargs)
+            if self.isInterruptionRequested():
+                return
 
             if len(granules) == 0:
                 self.finished.emit([], None)
@@ -439,6 +450,8 @@ class DataSearchWorker(QThread):
 
             self.progress.emit("Converting to GeoDataFrame...")
             gdf = self._granules_to_gdf(granules)
+            if self.isInterruptionRequested():
+                return
 
             self.finished.emit(granules, gdf)
 
@@ -647,6 +660,9 @@ class COGDisplayWorker(QThread):
         gdal.SetConfigOption("GDAL_HTTP_MAX_RETRY", "3")
         gdal.SetConfigOption("VSI_CACHE", "TRUE")
         gdal.SetConfigOption("VSI_CACHE_SIZE", "100000000")  # 100MB cache
+        # Decode multi-tile COG windows in parallel inside the GTiff driver.
+        gdal.SetConfigOption("GDAL_NUM_THREADS", "ALL_CPUS")
+        gdal.SetConfigOption("CPL_VSIL_CURL_CACHE_SIZE", "64000000")  # 64MB cap
 
     def _create_rgb_vrt(self, layer_name, sources, gdal):
         """Create a small local VRT that references three streamed COG sources."""
@@ -803,7 +819,7 @@ class DataDownloadWorker(QThread):
 
             for index, granule in enumerate(self.granules):
                 native_id = granule_native_id(granule, f"Item {index + 1}")
-                if self._cancelled:
+                if self._cancelled or self.isInterruptionRequested():
                     row = {
                         "index": index,
                         "native_id": native_id,
@@ -1001,6 +1017,11 @@ def normalized_difference(in_ar, out_ar, xoff, yoff, xsize, ysize,
 class EarthdataDockWidget(QDockWidget):
     """A dockable panel for NASA Earthdata search and visualization."""
 
+    # Total time closeEvent waits for interrupted workers, and how long it
+    # then waits on each straggler after terminate()
+    CLOSE_WAIT_MS = 1000
+    CLOSE_TERMINATE_WAIT_MS = 250
+
     def __init__(self, iface, parent=None):
         """Initialize the dock widget.
 
@@ -1022,6 +1043,7 @@ class EarthdataDockWidget(QDockWidget):
         # Data storage
         self._nasa_data = None
         self._nasa_data_names = []
+        self._dataset_combo_populated_hash = None
         self._search_results = None
         self._search_gdf = None
         self._footprints_layer = None
@@ -1039,6 +1061,9 @@ class EarthdataDockWidget(QDockWidget):
         self._last_download_output_dir = ""
         self._last_download_rows = []
         self._last_download_manifest = ""
+        self._last_progress_ts = 0.0
+        self._pending_progress = None
+        self._progress_flush_pending = False
         self._alert_worker = None
         self._alert_baseline_ids = set()
 
@@ -1047,6 +1072,8 @@ class EarthdataDockWidget(QDockWidget):
         self._search_worker = None
         self._download_worker = None
         self._cog_worker = None
+        self._pending_cog_layers = []
+        self._cog_added_count = 0
         self._collection_worker = None
         self._index_worker = None
 
@@ -1850,13 +1877,23 @@ class EarthdataDockWidget(QDockWidget):
         except Exception as e:
             self._log(f"Could not record recent search: {e}", error=True)
 
+    @staticmethod
+    def _dataset_items_hash(items):
+        """Return a cheap identity hash for a list of dataset combo items."""
+        return hash(tuple(item.get("label", "") for item in items))
+
     def _populate_dataset_combo(self, items):
         """Populate dataset combo while preserving row metadata as item data."""
         self.dataset_combo.blockSignals(True)
-        self.dataset_combo.clear()
-        for item in items:
-            self.dataset_combo.addItem(item.get("label", ""), item)
-        self.dataset_combo.blockSignals(False)
+        self.dataset_combo.setUpdatesEnabled(False)
+        try:
+            self.dataset_combo.clear()
+            for item in items:
+                self.dataset_combo.addItem(item.get("label", ""), item)
+        finally:
+            self.dataset_combo.setUpdatesEnabled(True)
+            self.dataset_combo.blockSignals(False)
+        self._dataset_combo_populated_hash = self._dataset_items_hash(items)
         self._on_dataset_changed(self.dataset_combo.currentIndex())
 
     def _select_default_dataset(self):
@@ -4378,28 +4415,46 @@ class EarthdataDockWidget(QDockWidget):
             gdal.SetConfigOption("GDAL_HTTP_MAX_RETRY", "3")
             gdal.SetConfigOption("VSI_CACHE", "TRUE")
             gdal.SetConfigOption("VSI_CACHE_SIZE", "100000000")  # 100MB cache
+            gdal.SetConfigOption("GDAL_NUM_THREADS", "ALL_CPUS")
+            gdal.SetConfigOption("CPL_VSIL_CURL_CACHE_SIZE", "64000000")
+
+        # Open COGs that share a host back-to-back so libcurl connections
+        # and the /vsicurl/ chunk cache stay warm between layers.
+        results = sorted(results, key=self._cog_result_sort_key)
+
+        # Create one layer per event-loop turn so the UI repaints between
+        # layers without re-entering the event loop mid-update.
+        self._pending_cog_layers = list(results)
+        self._cog_added_count = 0
+        QTimer.singleShot(0, self._load_next_cog_layer)
+
+    def _load_next_cog_layer(self):
+        """Add the next pending COG layer, then schedule the one after it."""
+        if not self._pending_cog_layers:
+            self._finish_cog_loading()
+            return
 
-        added_count = 0
-        for item in results:
-            layer_name = item[0]
-            raster_path = item[1]
-            try:
-                self._log(f"Loading: {layer_name}")
-                # Process events to update UI while loading
-                QApplication.processEvents()
+        item = self._pending_cog_layers.pop(0)
+        layer_name = item[0]
+        raster_path = item[1]
+        try:
+            self._log(f"Loading: {layer_name}")
+            layer = QgsRasterLayer(raster_path, layer_name)
 
-                layer = QgsRasterLayer(raster_path, layer_name)
+            if layer is not None and layer.isValid():
+                QgsProject.instance().addMapLayer(layer)
+                self._cog_added_count += 1
+                self._log(f"Added layer: {layer_name}")
+            else:
+                self._log(f"Could not load: {layer_name}", error=True)
+        except Exception as e:
+            self._log(f"Error adding layer {layer_name}: {e}", error=True)
 
-                if layer is not None and layer.isValid():
-                    QgsProject.instance().addMapLayer(layer)
-                    added_count += 1
-                    self._log(f"Added layer: {layer_name}")
-                else:
-                    self._log(f"Could not load: {layer_name}", error=True)
-            except Exception as e:
-                self._log(f"Error adding layer {layer_name}: {e}", error=True)
+        QTimer.singleShot(0, self._load_next_cog_layer)
 
-        # Restore UI after all layers are loaded
+    def _finish_cog_loading(self):
+        """Restore the UI and report once all pending COG layers are loaded."""
+        added_count = self._cog_added_count
         self.display_btn.setEnabled(True)
 
         if added_count > 0:
@@ -4417,6 +4472,12 @@ class EarthdataDockWidget(QDockWidget):
                 "Please verify NASA Earthdata credentials in Settings.",
             )
 
+    @staticmethod
+    def _cog_result_sort_key(item):
+        """Sort key grouping COG display results by source host, then URL."""
+        source = item[2] if len(item) > 2 else item[1]
+        return urlparse(source).netloc, source
+
     def _on_cog_error(self, error_msg):
         """Handle COG display error."""
         self.display_btn.setEnabled(True)
@@ -4495,12 +4556,37 @@ class EarthdataDockWidget(QDockWidget):
         self._download_worker.start()
 
     def _on_download_progress(self, percent, message):
-        """Handle download progress."""
+        """Handle download progress.
+
+        Every message goes to the log; the progress bar and status label are
+        refreshed at most about 10 times a second, and an update held back
+        by that throttle is shown by a trailing refresh.
+        """
+        self._log(message, status=False)
+        if percent < 100 and time.monotonic() - self._last_progress_ts < 0.1:
+            self._pending_progress = (percent, message)
+            if not self._progress_flush_pending:
+                self._progress_flush_pending = True
+                QTimer.singleShot(100, self._flush_download_progress)
+            return
+        self._show_download_progress(percent, message)
+
+    def _show_download_progress(self, percent, message):
+        """Refresh the progress bar and status label for one update."""
+        self._last_progress_ts = time.monotonic()
+        self._pending_progress = None
         self.progress_bar.setValue(percent)
-        self._log(message)
+        self._set_status(message)
+
+    def _flush_download_progress(self):
+        """Show a progress update held back by the throttle, if any."""
+        self._progress_flush_pending = False
+        if self._pending_progress is not None:
+            self._show_download_progress(*self._pending_progress)
 
     def _on_download_finished(self, files, manifest, queue_rows):
         """Handle download completion."""
+        self._flush_download_progress()
         self.download_btn.setEnabled(True)
         self.cancel_download_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
@@ -4534,19 +4620,19 @@ class EarthdataDockWidget(QDockWidget):
 
             if reply == QMessageBox.StandardButton.Yes:
                 for file_path in files:
-                    if any(
-                        str(file_path).lower().endswith(ext)
-                        for ext in [".tif", ".tiff", ".nc", ".hdf"]
-                    ):
-                        layer_name = os.path.basename(str(file_path))
-                        layer = QgsRasterLayer(str(file_path), layer_name)
-                        if layer.isValid():
-                            QgsProject.instance().addMapLayer(layer)
-                            self._log(f"Added: {layer_name}")
+                    path_str = str(file_path)
+                    if PurePath(path_str).suffix.lower() not in RASTER_FILE_EXTENSIONS:
+                        continue
+                    layer_name = os.path.basename(path_str)
+                    layer = QgsRasterLayer(path_str, layer_name)
+                    if layer.isValid():
+                        QgsProject.instance().addMapLayer(layer)
+                        self._log(f"Added: {layer_name}")
         self._notify_success("NASA Earthdata", "Download queue complete")
 
     def _on_download_error(self, error_msg):
         """Handle download error."""
+        self._flush_download_progress()
         self.download_btn.setEnabled(True)
         self.cancel_download_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
@@ -4585,13 +4671,23 @@ class EarthdataDockWidget(QDockWidget):
         self.orbit_min_spin.setValue(0)
         self.orbit_max_spin.setValue(0)
 
-        # Reset dataset list
+        # Reset dataset list, skipping the rebuild when the full catalog is
+        # already shown.
         if self._nasa_data_names:
-            self._populate_dataset_combo(self._nasa_data_names)
+            if self._dataset_combo_populated_hash != self._dataset_items_hash(
+                self._nasa_data_names
+            ):
+                self._populate_dataset_combo(self._nasa_data_names)
             self._select_default_dataset()
 
-    def _log(self, message, error=False):
-        """Log a message to the output text area."""
+    def _log(self, message, error=False, status=True):
+        """Log a message to the output text area.
+
+        Args:
+            message: Text to append.
+            error: Whether the message reports an error.
+            status: Whether to also show the message in the status label.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
         prefix = "ERROR: " if error else ""
         self.output_text.append(f"[{timestamp}] {prefix}{message}")
@@ -4600,7 +4696,11 @@ class EarthdataDockWidget(QDockWidget):
         scrollbar = self.output_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
-        # Update status
+        if status:
+            self._set_status(message, error)
+
+    def _set_status(self, message, error=False):
+        """Show a short form of a message in the status label."""
         if error:
             self.status_label.setText(f"Error: {message[:50]}...")
             self.status_label.setStyleSheet("color: red; font-size: 10px;")
@@ -4621,15 +4721,41 @@ class EarthdataDockWidget(QDockWidget):
         """Handle dock widget close event."""
         self._finish_draw_bbox()
 
-        # Stop workers
-        for worker in [
-            self._catalog_worker,
-            self._search_worker,
-            self._download_worker,
-            self._cog_worker,
-        ]:
-            if worker and worker.isRunning():
-                worker.terminate()
-                worker.wait()
+        # Stop workers: ask them all to stop first, then wait against one
+        # shared deadline, so shutdown is bounded by CLOSE_WAIT_MS in total
+        # rather than per worker.
+        workers = [
+            worker
+            for worker in (
+                self._catalog_worker,
+                self._search_worker,
+                self._download_worker,
+                self._cog_worker,
+            )
+            if worker and worker.isRunning()
+        ]
+        for worker in workers:
+            worker.requestInterruption()
+            if hasattr(worker, "cancel"):
+                worker.cancel()
+        deadline = time.monotonic() + self.CLOSE_WAIT_MS / 1000
+        stragglers = [
+            worker
+            for worker in workers
+            if not worker.wait(max(0, int((deadline - time.monotonic()) * 1000)))
+        ]
+        for worker in stragglers:
+            worker.terminate()
+        for worker in stragglers:
+            worker.wait(self.CLOSE_TERMINATE_WAIT_MS)
+        self._cog_worker = None
+
+        # Release the /vsicurl/ chunk cache held for streamed COGs.
+        try:
+            from osgeo import gdal
+
+            gdal.VSICurlClearCache()
+        except Exception:
+            pass  # nosec B110
 
         event.accept()
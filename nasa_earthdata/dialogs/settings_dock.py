@@ -5,11 +5,27 @@ This module provides a settings panel for configuring NASA Earthdata
 credentials and plugin preferences.
 """
 
+import base64
+import netrc
 import os
 import platform
+import shutil
+import stat
+import tempfile
+import types
+import urllib.error
 from pathlib import Path
-
-from qgis.PyQt.QtCore import Qt, QSettings, pyqtSignal
+from typing import NamedTuple
+
+from qgis.PyQt.QtCore import (
+    Qt,
+    QDir,
+    QEvent,
+    QSettings,
+    QThread,
+    QTimer,
+    pyqtSignal,
+)
 from qgis.PyQt.QtWidgets import (
     QDockWidget,
     QWidget,
@@ -22,6 +38,7 @@ from qgis.PyQt.QtWidgets import (
     QSpinBox,
     QCheckBox,
     QFormLayout,
+    QGridLayout,
     QMessageBox,
     QFileDialog,
     QTabWidget,
@@ -29,6 +46,202 @@ from qgis.PyQt.QtWidgets import (
 )
 from qgis.PyQt.QtGui import QFont, QPalette
 
+from ..core.net import https_only_urlopen
+from ..core.venv_manager import REQUIRED_PACKAGES, import_earthaccess
+from .deps_manager import DepsCheckWorker, DepsInstallWorker
+
+# NASA Earthdata Login host and the ~/.netrc file holding its credentials
+EARTHDATA_HOST = "urs.earthdata.nasa.gov"
+# Earthdata Login API endpoint listing a user's tokens; a read-only request
+# that answers 401 for a wrong username or password
+EARTHDATA_TOKENS_URL = f"https://{EARTHDATA_HOST}/api/users/tokens"
+NETRC_PATH = Path.home() / ".netrc"
+NETRC_MODE = stat.S_IRUSR | stat.S_IWUSR  # readable/writable only by owner
+
+# Default values for the non-empty settings, shared by the widgets, the
+# QSettings fallbacks, and "Reset to Defaults"
+DEFAULTS = types.MappingProxyType(
+    {
+        "catalog_url": "https://github.com/opengeos/NASA-Earth-Data/raw/main/nasa_earth_data.tsv",
+        "download_threads": 4,
+        "default_max_items": 50,
+        "auto_zoom": True,
+        "notifications": True,
+        "enable_cache": True,
+        "debug": False,
+    }
+)
+
+
+class FieldAccessor(NamedTuple):
+    """Names of the widget methods used to load, read, and watch a field."""
+
+    setter: str
+    getter: str
+    signal: str
+
+
+def _format_netrc(auths):
+    """Serialize a parsed ``netrc.netrc`` object back to .netrc file text.
+
+    Unlike ``str(netrc)``, this writes the ``default`` entry with the
+    ``default`` keyword and emits it after every machine entry.
+    """
+    entries = []
+    hosts = dict(auths.hosts)
+    default = hosts.pop("default", None)
+    for host, (login, account, password) in hosts.items():
+        entries.append(_format_netrc_entry(f"machine {host}", login, account, password))
+    if default is not None:
+        entries.append(_format_netrc_entry("default", *default))
+    for name, lines in auths.macros.items():
+        entries.append(f"macdef {name}\n" + "".join(lines) + "\n")
+    return "\n".join(entries)
+
+
+def _format_netrc_entry(header, login, account, password):
+    """Format one .netrc machine/default entry."""
+    lines = [header]
+    if login:
+        lines.append(f"    login {login}")
+    if account:
+        lines.append(f"    account {account}")
+    if password:
+        lines.append(f"    password {password}")
+    return "\n".join(lines) + "\n"
+
+
+def _replace_netrc_entry(content, host, username, password):
+    """Replace the ``host`` entry in raw .netrc text, line by line.
+
+    Used when the stdlib parser rejects the file: every line outside the
+    ``machine host`` block is kept as-is and the new entry is appended.
+    """
+    lines = content.strip().split("\n") if content.strip() else []
+    new_lines = []
+    skip_until_next_machine = False
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("machine") or stripped.startswith("default"):
+            # Skip the existing entry for this host up to the next entry
+            if stripped.startswith("machine") and host in stripped.split():
+                skip_until_next_machine = True
+                continue
+            skip_until_next_machine = False
+
+        if not skip_until_next_machine:
+            new_lines.append(line)
+
+    entry = f"machine {host}\n    login {username}\n    password {password}\n"
+    if new_lines:
+        return "\n".join(new_lines) + "\n\n" + entry
+    return entry
+
+
+def _fast_clear(path):
+    """Delete everything inside ``path`` while keeping the directory itself.
+
+    Files are unlinked straight from the ``os.scandir`` listing and only
+    subdirectories are handed to ``shutil.rmtree``. A failing entry does not
+    stop the rest of the clear.
+
+    Args:
+        path: Directory to empty.
+
+    Returns:
+        List of error message strings, one per entry that could not be removed.
+    """
+    errors = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass  # nosec B110 - already gone
+            except OSError as e:
+                errors.append(f"{entry.name}: {e.strerror or e}")
+    return errors
+
+
+class CacheClearWorker(QThread):
+    """Worker thread that deletes the contents of a cache directory."""
+
+    finished = pyqtSignal(bool, str)  # success, error message
+
+    def __init__(self, cache_dir, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+
+    def run(self):
+        """Remove every entry inside the cache directory, keeping the directory."""
+        try:
+            errors = _fast_clear(self.cache_dir)
+        except Exception as e:
+            self.finished.emit(False, str(e))
+            return
+        if errors:
+            shown = "\n".join(errors[:5])
+            if len(errors) > 5:
+                shown += f"\n... and {len(errors) - 5} more"
+            self.finished.emit(False, shown)
+        else:
+            self.finished.emit(True, "")
+
+
+class CredentialsTestWorker(QThread):
+    """Worker thread that checks credentials against NASA Earthdata Login.
+
+    The check is a basic-auth request to the public Earthdata Login API, so
+    this thread neither touches ``os.environ`` nor writes ~/.netrc.
+    Exporting and persisting valid credentials is left to the GUI thread.
+    """
+
+    finished = pyqtSignal(bool, str)  # authenticated, error message
+
+    def __init__(self, username, password, parent=None):
+        super().__init__(parent)
+        self.username = username
+        self.password = password
+
+    def run(self):
+        """Attempt the login and report the outcome."""
+        token = base64.b64encode(f"{self.username}:{self.password}".encode("utf-8"))
+        headers = {"Authorization": "Basic " + token.decode("ascii")}
+        try:
+            with https_only_urlopen(EARTHDATA_TOKENS_URL, timeout=30, headers=headers):
+                self.finished.emit(True, "")
+                return
+        except urllib.error.HTTPError as e:
+            if e.code == 401:
+                error = "✗ Authentication failed"
+            else:
+                error = f"Error: HTTP {e.code}"
+        except Exception as e:
+            error = f"Error: {str(e)[:50]}"
+
+        self.finished.emit(False, error)
+
+
+class EarthaccessWarmupWorker(QThread):
+    """Worker thread that imports ``earthaccess`` ahead of its first use.
+
+    Importing ``earthaccess`` pulls in requests, fsspec, s3fs, and friends,
+    which can stall the UI for seconds. Once this thread has finished,
+    ``SettingsDockWidget._ensure_earthaccess`` returns the memoized module.
+    Like every worker here, it must not touch Qt widgets.
+    """
+
+    def run(self):
+        """Import earthaccess, ignoring failures (they surface on real use)."""
+        try:
+            SettingsDockWidget._ensure_earthaccess()
+        except Exception:
+            pass  # nosec B110
+
 
 class SettingsDockWidget(QDockWidget):
     """A settings panel for configuring NASA Earthdata plugin options."""
@@ -37,7 +250,66 @@ class SettingsDockWidget(QDockWidget):
     deps_installed = pyqtSignal()
 
     # Settings keys
-    SETTINGS_PREFIX = "NASAEarthdata/"
+    SETTINGS_GROUP = "NASAEarthdata"
+    SETTINGS_PREFIX = SETTINGS_GROUP + "/"
+
+    # Header font shared by every dock instance (see _header_font)
+    _header_font_cache = None
+
+    # Parsed ~/.netrc with the file identity it was read at (see _load_netrc)
+    _netrc_cache = None
+
+    # earthaccess module once imported (see _ensure_earthaccess)
+    _earthaccess = None
+
+    # Label text colors per theme, and the dock stylesheets built from them
+    TEXT_COLORS_LIGHT = {
+        "text": "#202124",
+        "muted": "#5f6368",
+        "success": "#1b5e20",
+        "warning": "#8a5a00",
+        "error": "#b00020",
+        "info": "#0b57d0",
+    }
+    TEXT_COLORS_DARK = {
+        "text": "#f0f3f5",
+        "muted": "#d0d7de",
+        "success": "#7ee2a8",
+        "warning": "#ffd166",
+        "error": "#ff8a80",
+        "info": "#9cc9ff",
+    }
+    _dock_stylesheet_cache = {}
+
+    # Tab indices
+    DEPENDENCIES_TAB = 0
+    CREDENTIALS_TAB = 1
+    GENERAL_TAB = 2
+    ADVANCED_TAB = 3
+
+    # Widget kind -> accessor method names
+    FIELD_ACCESSORS = {
+        "text": FieldAccessor("setText", "text", "editingFinished"),
+        "value": FieldAccessor("setValue", "value", "valueChanged"),
+        "check": FieldAccessor("setChecked", "isChecked", "toggled"),
+    }
+    # (setting key, widget attribute, widget kind) per tab; defaults come
+    # from DEFAULTS, with "" for the string settings missing there.
+    SETTINGS_FIELDS = {
+        GENERAL_TAB: (
+            ("download_dir", "download_dir_input", "text"),
+            ("download_threads", "download_threads_spin", "value"),
+            ("default_max_items", "default_max_items_spin", "value"),
+            ("auto_zoom", "auto_zoom_check", "check"),
+            ("notifications", "notifications_check", "check"),
+        ),
+        ADVANCED_TAB: (
+            ("catalog_url", "catalog_url_input", "text"),
+            ("enable_cache", "enable_cache_check", "check"),
+            ("cache_dir", "cache_dir_input", "text"),
+            ("debug", "debug_check", "check"),
+        ),
+    }
 
     def __init__(self, iface, parent=None):
         """Initialize the settings dock widget.
@@ -50,6 +322,31 @@ class SettingsDockWidget(QDockWidget):
         self.iface = iface
         self.settings = QSettings()
         self._deps_worker = None
+        self._deps_check_worker = None
+        self._cache_clear_worker = None
+        self._creds_test_worker = None
+        self._earthaccess_warmup_worker = None
+        self._dir_dialog = None
+
+        # Install progress is applied at most every 100 ms (see _flush_progress)
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # General/Advanced edits are saved 500 ms after the last change; only
+        # the keys edited since the last save are written
+        self._dirty_keys = set()
+        # Set by "Reset to Defaults" until the restored values are saved
+        self._unsaved_defaults = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_to_qsettings)
+        self._deps_refresh_pending = False
+        # Last (text, style) written per package label, and the install text
+        self._last_deps_state = {}
+        self._last_install_btn_text = None
 
         self.setAllowedAreas(
             Qt.DockWidgetArea.LeftDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea
@@ -58,6 +355,96 @@ class SettingsDockWidget(QDockWidget):
         self._setup_ui()
         self._load_settings()
 
+    @classmethod
+    def _header_font(cls):
+        """Return the shared bold header font, creating it on first use."""
+        if cls._header_font_cache is None:
+            font = QFont()
+            font.setPointSize(11)
+            font.setBold(True)
+            cls._header_font_cache = font
+        return cls._header_font_cache
+
+    @classmethod
+    def _ensure_earthaccess(cls):
+        """Return the earthaccess module, importing it on first use only.
+
+        ``import_earthaccess`` re-checks the plugin venv on disk each call,
+        so the module is memoized once it imports successfully. Safe to call
+        from worker threads.
+
+        Raises:
+            ImportError: If earthaccess is missing or fails to import.
+        """
+        if SettingsDockWidget._earthaccess is None:
+            SettingsDockWidget._earthaccess = import_earthaccess()
+        return SettingsDockWidget._earthaccess
+
+    def _read_settings(self):
+        """Read the plugin settings group from QSettings in one pass.
+
+        Not cached across calls: the search dock and other modules write
+        keys such as ``download_dir`` themselves.
+        """
+        values = {}
+        self.settings.beginGroup(self.SETTINGS_GROUP)
+        try:
+            for key in self.settings.childKeys():
+                values[key] = self.settings.value(key)
+        finally:
+            self.settings.endGroup()
+        return values
+
+    @staticmethod
+    def _coerce_setting(value, default):
+        """Coerce a raw QSettings value to the type of ``default``."""
+        if value is None:
+            return default
+        if isinstance(default, bool):
+            if isinstance(value, str):
+                return value.strip().lower() in ("true", "1", "yes")
+            return bool(value)
+        if isinstance(default, int):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return default
+        return str(value)
+
+    def _setting(self, key, default):
+        """Return one stored setting coerced to the type of ``default``."""
+        return self._coerce_setting(
+            self.settings.value(self.SETTINGS_PREFIX + key), default
+        )
+
+    def _write_settings(self, values):
+        """Write the settings that differ from what QSettings currently holds.
+
+        Args:
+            values: Mapping of setting key (without group prefix) to value.
+
+        Returns:
+            True if any value differed from the stored one and was written.
+        """
+        changed = False
+        self.settings.beginGroup(self.SETTINGS_GROUP)
+        try:
+            for key, value in values.items():
+                current = self.settings.value(key)
+                if (
+                    current is not None
+                    and self._coerce_setting(current, value) == value
+                ):
+                    continue
+                self.settings.setValue(key, value)
+                changed = True
+        finally:
+            self.settings.endGroup()
+        # No explicit sync(): QSettings flushes to disk from the event loop
+        # and on destruction, and other QSettings objects in this process
+        # see the new values immediately.
+        return changed
+
     def _uses_dark_palette(self):
         """Return whether the active Qt palette is dark."""
         window_role = getattr(QPalette, "ColorRole", QPalette).Window
@@ -67,26 +454,58 @@ class SettingsDockWidget(QDockWidget):
         )
         return luminance < 128
 
-    def _text_style(self, tone="text", font_size=None, bold=False):
-        """Build readable label styles for both light and dark QGIS themes."""
+    def _dock_stylesheet(self):
+        """Return the dock-wide stylesheet for the active light/dark theme.
+
+        Widgets opt in through ``role``/``state`` properties (see
+        ``_set_state``), so Qt parses a single sheet for the whole dock and
+        a state change only re-polishes the affected widget.
+        """
         dark = self._uses_dark_palette()
-        colors = {
-            "text": "#f0f3f5" if dark else "#202124",
-            "muted": "#d0d7de" if dark else "#5f6368",
-            "success": "#7ee2a8" if dark else "#1b5e20",
-            "warning": "#ffd166" if dark else "#8a5a00",
-            "error": "#ff8a80" if dark else "#b00020",
-            "info": "#9cc9ff" if dark else "#0b57d0",
-        }
-        declarations = [f"color: {colors.get(tone, colors['text'])};"]
-        if font_size is not None:
-            declarations.append(f"font-size: {font_size}px;")
-        if bold:
-            declarations.append("font-weight: bold;")
-        return " ".join(declarations)
+        sheet = self._dock_stylesheet_cache.get(dark)
+        if sheet is None:
+            colors = self.TEXT_COLORS_DARK if dark else self.TEXT_COLORS_LIGHT
+            rules = [
+                'QPushButton[role="primary"] '
+                "{ background-color: #0B3D91; color: white; }",
+                f'QPushButton[role="danger"] {{ color: {colors["error"]}; }}',
+                f'QLabel[role="hint"] {{ color: {colors["muted"]}; font-size: 10px; }}',
+                'QLabel[role="header"] { font-weight: bold; }',
+                "QLabel#settingsStatus { font-size: 10px; }",
+            ]
+            rules.extend(
+                f'QLabel[state="{tone}"] {{ color: {color}; }}'
+                for tone, color in colors.items()
+            )
+            rules.append('QLabel[strong="true"] { font-weight: bold; }')
+            sheet = "\n".join(rules)
+            self._dock_stylesheet_cache[dark] = sheet
+        return sheet
+
+    @staticmethod
+    def _set_state(widget, state, strong=False):
+        """Switch a label's color through the dock stylesheet's state rules.
+
+        Args:
+            widget: Label to restyle.
+            state: Text tone ("text", "muted", "success", "warning",
+                "error", "info"), or "" for the default color.
+            strong: Whether to show the text in bold.
+        """
+        current = (widget.property("state"), bool(widget.property("strong")))
+        if current == (state, strong):
+            return
+        widget.setProperty("state", state)
+        widget.setProperty("strong", strong)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def _setup_ui(self):
         """Set up the settings UI."""
+        # One stylesheet for every widget in the dock
+        self.setStyleSheet(self._dock_stylesheet())
+
         # Main widget
         main_widget = QWidget()
         self.setWidget(main_widget)
@@ -97,10 +516,7 @@ class SettingsDockWidget(QDockWidget):
 
         # Header
         header_label = QLabel("NASA Earthdata Settings")
-        header_font = QFont()
-        header_font.setPointSize(11)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        header_label.setFont(self._header_font())
         header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(header_label)
 
@@ -108,27 +524,34 @@ class SettingsDockWidget(QDockWidget):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
 
-        # Dependencies tab (first tab)
+        # Dependencies tab (first tab, built eagerly since it is shown first)
         deps_tab = self._create_dependencies_tab()
         self.tab_widget.addTab(deps_tab, "Dependencies")
 
-        # Credentials tab
-        credentials_tab = self._create_credentials_tab()
-        self.tab_widget.addTab(credentials_tab, "Credentials")
-
-        # General settings tab
-        general_tab = self._create_general_tab()
-        self.tab_widget.addTab(general_tab, "General")
-
-        # Advanced settings tab
-        advanced_tab = self._create_advanced_tab()
-        self.tab_widget.addTab(advanced_tab, "Advanced")
+        # Remaining tabs start as placeholders and are built on first activation
+        self._tab_builders = {
+            self.CREDENTIALS_TAB: (
+                self._create_credentials_tab,
+                self._load_credentials_settings,
+            ),
+            self.GENERAL_TAB: (self._create_general_tab, self._load_general_settings),
+            self.ADVANCED_TAB: (
+                self._create_advanced_tab,
+                self._load_advanced_settings,
+            ),
+        }
+        self._tab_loaders = {
+            index: loader for index, (_builder, loader) in self._tab_builders.items()
+        }
+        for title in ("Credentials", "General", "Advanced"):
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
 
         # Buttons
         button_layout = QHBoxLayout()
 
         self.save_btn = QPushButton("Save Settings")
-        self.save_btn.setStyleSheet("background-color: #0B3D91; color: white;")
+        self.save_btn.setProperty("role", "primary")
         self.save_btn.clicked.connect(self._save_settings)
         button_layout.addWidget(self.save_btn)
 
@@ -143,12 +566,78 @@ class SettingsDockWidget(QDockWidget):
 
         # Status label
         self.status_label = QLabel("Settings loaded")
-        self.status_label.setStyleSheet("color: gray; font-size: 10px;")
+        self.status_label.setObjectName("settingsStatus")
+        self.status_label.setProperty("state", "muted")
         layout.addWidget(self.status_label)
 
+    def _is_tab_built(self, index):
+        """Return whether the tab at ``index`` has been built."""
+        return index not in self._tab_builders
+
+    def _materialize_tab(self, index):
+        """Replace a placeholder tab with its real widget on first activation."""
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+
+        builder, loader = entry
+        widget = builder()
+        title = self.tab_widget.tabText(index)
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.blockSignals(True)
+        try:
+            placeholder = self.tab_widget.widget(index)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, widget, title)
+            self.tab_widget.setCurrentIndex(current)
+            if placeholder is not None:
+                placeholder.deleteLater()
+        finally:
+            self.tab_widget.blockSignals(False)
+        loader()
+        self._connect_auto_save(index)
+
+        if index == self.CREDENTIALS_TAB:
+            self._warm_up_earthaccess()
+
+    def _connect_auto_save(self, index):
+        """Schedule a debounced save whenever a General/Advanced field changes.
+
+        Credentials are not auto-saved: saving them writes ~/.netrc.
+        """
+        if index not in self.SETTINGS_FIELDS:
+            return
+        for key, signal in self._field_widgets(index, "signal"):
+            signal.connect(lambda *_args, key=key: self._schedule_save(key))
+
+    def _schedule_save(self, key):
+        """Mark a setting as edited and (re)start the save debounce timer.
+
+        Args:
+            key: Setting key of the edited field.
+        """
+        self._dirty_keys.add(key)
+        self._save_timer.start()
+
+    def _warm_up_earthaccess(self):
+        """Start importing earthaccess in the background if not yet imported."""
+        if (
+            SettingsDockWidget._earthaccess is not None
+            or self._earthaccess_warmup_worker is not None
+        ):
+            return
+        self._earthaccess_warmup_worker = EarthaccessWarmupWorker()
+        self._earthaccess_warmup_worker.start()
+
+    def _build_all_tabs(self):
+        """Build every tab that is still a placeholder."""
+        for index in list(self._tab_builders):
+            self._materialize_tab(index)
+
     def _create_credentials_tab(self):
         """Create the credentials settings tab."""
         widget = QWidget()
+        widget.setUpdatesEnabled(False)
         layout = QVBoxLayout(widget)
 
         # NASA Earthdata credentials group
@@ -161,7 +650,7 @@ class SettingsDockWidget(QDockWidget):
             "Register at: https://urs.earthdata.nasa.gov/"
         )
         info_label.setWordWrap(True)
-        info_label.setStyleSheet(self._text_style("muted", font_size=10))
+        info_label.setProperty("role", "hint")
         creds_layout.addRow(info_label)
 
         # Username
@@ -189,15 +678,12 @@ class SettingsDockWidget(QDockWidget):
 
         # Netrc file group
         netrc_group = QGroupBox(".netrc File")
-        netrc_layout = QFormLayout(netrc_group)
-
-        netrc_info = QLabel(
+        # Static help goes in the tooltip rather than an extra label row
+        netrc_group.setToolTip(
             "Alternatively, you can use a .netrc file for authentication.\n"
             "The file should be located at: ~/.netrc"
         )
-        netrc_info.setWordWrap(True)
-        netrc_info.setStyleSheet(self._text_style("muted", font_size=10))
-        netrc_layout.addRow(netrc_info)
+        netrc_layout = QFormLayout(netrc_group)
 
         # Check netrc
         self.check_netrc_btn = QPushButton("Check .netrc File")
@@ -211,11 +697,13 @@ class SettingsDockWidget(QDockWidget):
         layout.addWidget(netrc_group)
 
         layout.addStretch()
+        widget.setUpdatesEnabled(True)
         return widget
 
     def _create_general_tab(self):
         """Create the general settings tab."""
         widget = QWidget()
+        widget.setUpdatesEnabled(False)
         layout = QVBoxLayout(widget)
 
         # Download settings group
@@ -236,7 +724,7 @@ class SettingsDockWidget(QDockWidget):
         # Download threads
         self.download_threads_spin = QSpinBox()
         self.download_threads_spin.setRange(1, 16)
-        self.download_threads_spin.setValue(4)
+        self.download_threads_spin.setValue(DEFAULTS["download_threads"])
         download_layout.addRow("Download Threads:", self.download_threads_spin)
 
         layout.addWidget(download_group)
@@ -248,27 +736,29 @@ class SettingsDockWidget(QDockWidget):
         # Default max items
         self.default_max_items_spin = QSpinBox()
         self.default_max_items_spin.setRange(10, 500)
-        self.default_max_items_spin.setValue(50)
+        self.default_max_items_spin.setValue(DEFAULTS["default_max_items"])
         display_layout.addRow("Default Max Items:", self.default_max_items_spin)
 
         # Auto-zoom to footprints
         self.auto_zoom_check = QCheckBox()
-        self.auto_zoom_check.setChecked(True)
+        self.auto_zoom_check.setChecked(DEFAULTS["auto_zoom"])
         display_layout.addRow("Auto-zoom to Results:", self.auto_zoom_check)
 
         # Show notifications
         self.notifications_check = QCheckBox()
-        self.notifications_check.setChecked(True)
+        self.notifications_check.setChecked(DEFAULTS["notifications"])
         display_layout.addRow("Show Notifications:", self.notifications_check)
 
         layout.addWidget(display_group)
 
         layout.addStretch()
+        widget.setUpdatesEnabled(True)
         return widget
 
     def _create_advanced_tab(self):
         """Create the advanced settings tab."""
         widget = QWidget()
+        widget.setUpdatesEnabled(False)
         layout = QVBoxLayout(widget)
 
         # Data source group
@@ -277,9 +767,7 @@ class SettingsDockWidget(QDockWidget):
 
         # NASA data catalog URL
         self.catalog_url_input = QLineEdit()
-        self.catalog_url_input.setText(
-            "https://github.com/opengeos/NASA-Earth-Data/raw/main/nasa_earth_data.tsv"
-        )
+        self.catalog_url_input.setText(DEFAULTS["catalog_url"])
         source_layout.addRow("Catalog URL:", self.catalog_url_input)
 
         layout.addWidget(source_group)
@@ -290,7 +778,7 @@ class SettingsDockWidget(QDockWidget):
 
         # Enable cache
         self.enable_cache_check = QCheckBox()
-        self.enable_cache_check.setChecked(True)
+        self.enable_cache_check.setChecked(DEFAULTS["enable_cache"])
         cache_layout.addRow("Enable Cache:", self.enable_cache_check)
 
         # Cache directory
@@ -309,6 +797,12 @@ class SettingsDockWidget(QDockWidget):
         self.clear_cache_btn.clicked.connect(self._clear_cache)
         cache_layout.addRow("", self.clear_cache_btn)
 
+        # Busy indicator while the cache is being cleared (hidden by default)
+        self.clear_cache_progress = QProgressBar()
+        self.clear_cache_progress.setRange(0, 0)
+        self.clear_cache_progress.setVisible(False)
+        cache_layout.addRow("", self.clear_cache_progress)
+
         layout.addWidget(cache_group)
 
         # Debug group
@@ -317,17 +811,20 @@ class SettingsDockWidget(QDockWidget):
 
         # Debug mode
         self.debug_check = QCheckBox()
-        self.debug_check.setChecked(False)
+        self.debug_check.setChecked(DEFAULTS["debug"])
         debug_layout.addRow("Debug Mode:", self.debug_check)
 
         layout.addWidget(debug_group)
 
         layout.addStretch()
+        widget.setUpdatesEnabled(True)
         return widget
 
     def _create_dependencies_tab(self):
         """Create the dependencies management tab."""
         widget = QWidget()
+        # Tabs suppress repaints while rows are added, then repaint once.
+        widget.setUpdatesEnabled(False)
         layout = QVBoxLayout(widget)
 
         # Info label
@@ -337,31 +834,34 @@ class SettingsDockWidget(QDockWidget):
             "isolated virtual environment."
         )
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("font-size: 10px;")
+        info_label.setProperty("role", "hint")
         layout.addWidget(info_label)
 
         # Package status group
         status_group = QGroupBox("Package Status")
-        self._deps_status_layout = QFormLayout(status_group)
+        # A grid is filled row by row without the per-row field-width pass
+        # QFormLayout does, and is only attached to the group once complete.
+        self._deps_status_layout = QGridLayout()
+        self._deps_status_layout.setColumnStretch(1, 1)
 
         # Create status labels for required plugin packages.
         self._deps_labels = {}
-        from ..core.venv_manager import REQUIRED_PACKAGES
-
         required_header = QLabel("Required (NASA Earthdata core):")
-        required_header.setStyleSheet("font-weight: bold;")
-        self._deps_status_layout.addRow(required_header)
-        for package_name, _version_spec in REQUIRED_PACKAGES:
+        required_header.setProperty("role", "header")
+        self._deps_status_layout.addWidget(required_header, 0, 0, 1, 2)
+        for row, (package_name, _version_spec) in enumerate(REQUIRED_PACKAGES, 1):
             label = QLabel("Checking...")
-            label.setStyleSheet("color: gray;")
+            label.setProperty("state", "muted")
             self._deps_labels[package_name] = label
-            self._deps_status_layout.addRow(f"{package_name}:", label)
+            self._deps_status_layout.addWidget(QLabel(f"{package_name}:"), row, 0)
+            self._deps_status_layout.addWidget(label, row, 1)
 
+        status_group.setLayout(self._deps_status_layout)
         layout.addWidget(status_group)
 
         # Install button
         self.install_deps_btn = QPushButton("Install Dependencies")
-        self.install_deps_btn.setStyleSheet("background-color: #0B3D91; color: white;")
+        self.install_deps_btn.setProperty("role", "primary")
         self.install_deps_btn.clicked.connect(self._install_dependencies)
         layout.addWidget(self.install_deps_btn)
 
@@ -378,7 +878,7 @@ class SettingsDockWidget(QDockWidget):
 
         # Cancel button (hidden by default)
         self.cancel_deps_btn = QPushButton("Cancel")
-        self.cancel_deps_btn.setStyleSheet("color: red;")
+        self.cancel_deps_btn.setProperty("role", "danger")
         self.cancel_deps_btn.setVisible(False)
         self.cancel_deps_btn.clicked.connect(self._cancel_deps_install)
         layout.addWidget(self.cancel_deps_btn)
@@ -389,6 +889,7 @@ class SettingsDockWidget(QDockWidget):
         layout.addWidget(self.refresh_deps_btn)
 
         layout.addStretch()
+        widget.setUpdatesEnabled(True)
 
         # Initial status check
         self._refresh_deps_status()
@@ -396,35 +897,105 @@ class SettingsDockWidget(QDockWidget):
         return widget
 
     def _refresh_deps_status(self):
-        """Refresh the dependency status display."""
-        from ..core.venv_manager import check_dependencies
+        """Refresh the dependency status display from a background check."""
+        if self._deps_check_worker is not None and self._deps_check_worker.isRunning():
+            # Re-check once the running check finishes so the result is fresh.
+            self._deps_refresh_pending = True
+            return
+
+        self._deps_refresh_pending = False
+        self._deps_check_worker = DepsCheckWorker()
+        self._deps_check_worker.result.connect(self._apply_deps_status)
+        self._deps_check_worker.failed.connect(self._on_deps_check_failed)
+        self._deps_check_worker.start()
+
+    def _restart_pending_deps_check(self):
+        """Start the re-check queued while a check was running, if any.
 
-        all_ok, missing, installed = check_dependencies()
+        Returns:
+            True if a new check was started and the finished result is stale.
+        """
+        if not self._deps_refresh_pending:
+            return False
+        # run() has already emitted, so this wait returns almost at once.
+        self._deps_check_worker.wait()
+        self._refresh_deps_status()
+        return True
+
+    def _apply_deps_status(self, all_ok, missing, installed):
+        """Update the dependency status labels with a finished check result.
+
+        Args:
+            all_ok: True if all required packages are installed.
+            missing: List of (package_name, version_spec) for missing packages.
+            installed: List of (package_name, version_string) for installed packages.
+        """
+        if self._restart_pending_deps_check():
+            return
+
+        try:
+            self._show_deps_status(all_ok, missing, installed)
+        except RuntimeError:
+            # The dock was deleted (plugin unload) before the check finished.
+            pass  # nosec B110
+
+    def _on_deps_check_failed(self, error):
+        """Show that the dependency check itself failed.
+
+        Args:
+            error: Error message from the check.
+        """
+        if self._restart_pending_deps_check():
+            return
 
+        try:
+            for package_name in self._deps_labels:
+                self._set_deps_label(package_name, "Check failed", "warning")
+            self.deps_progress_label.setText(f"Could not check dependencies: {error}")
+            self._set_state(self.deps_progress_label, "warning")
+            self.deps_progress_label.setVisible(True)
+        except RuntimeError:
+            pass  # nosec B110
+
+    def _show_deps_status(self, all_ok, missing, installed):
+        """Write dependency status to the labels and install button."""
         for package_name, version in installed:
-            if package_name in self._deps_labels:
-                self._deps_labels[package_name].setText(f"v{version} (installed)")
-                self._deps_labels[package_name].setStyleSheet(
-                    "color: green; font-weight: bold;"
-                )
+            self._set_deps_label(
+                package_name, f"v{version} (installed)", "success", strong=True
+            )
 
         for package_name, _version_spec in missing:
-            if package_name in self._deps_labels:
-                self._deps_labels[package_name].setText("Not installed")
-                self._deps_labels[package_name].setStyleSheet("color: red;")
+            self._set_deps_label(package_name, "Not installed", "error")
 
-        self.install_deps_btn.setEnabled(not all_ok)
+        installing = self._deps_worker is not None and self._deps_worker.isRunning()
+        self.install_deps_btn.setEnabled(not all_ok and not installing)
         if all_ok:
-            self.install_deps_btn.setText("All Dependencies Installed")
+            btn_text = "All Dependencies Installed"
         else:
-            self.install_deps_btn.setText(
-                f"Install Dependencies ({len(missing)} missing)"
-            )
+            btn_text = f"Install Dependencies ({len(missing)} missing)"
+        if btn_text != self._last_install_btn_text:
+            self.install_deps_btn.setText(btn_text)
+            self._last_install_btn_text = btn_text
+
+    def _set_deps_label(self, package_name, text, state, strong=False):
+        """Update a package status label, skipping writes that change nothing.
+
+        Setting an identical text or re-polishing an unchanged state still
+        makes Qt re-layout the label, so repeated refreshes only touch labels
+        whose status actually changed.
+        """
+        label = self._deps_labels.get(package_name)
+        if label is None:
+            return
+        entry = (text, state, strong)
+        if self._last_deps_state.get(package_name) == entry:
+            return
+        label.setText(text)
+        self._set_state(label, state, strong=strong)
+        self._last_deps_state[package_name] = entry
 
     def _install_dependencies(self):
         """Start installing missing dependencies."""
-        from .deps_manager import DepsInstallWorker
-
         # Guard against concurrent installs
         if self._deps_worker is not None and self._deps_worker.isRunning():
             return
@@ -437,7 +1008,7 @@ class SettingsDockWidget(QDockWidget):
         self.deps_progress_bar.setValue(0)
         self.deps_progress_label.setVisible(True)
         self.deps_progress_label.setText("Starting installation...")
-        self.deps_progress_label.setStyleSheet("")
+        self._set_state(self.deps_progress_label, "")
         self.cancel_deps_btn.setVisible(True)
         self.cancel_deps_btn.setEnabled(True)
 
@@ -454,6 +1025,19 @@ class SettingsDockWidget(QDockWidget):
             percent: Installation progress percentage (0-100).
             message: Status message describing current operation.
         """
+        # pip can report many lines per second; keep only the latest update
+        # and let the timer apply it.
+        self._pending_progress = (percent, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the latest pending install progress, if any, to the UI."""
+        if self._pending_progress is None:
+            self._progress_timer.stop()
+            return
+        percent, message = self._pending_progress
+        self._pending_progress = None
         self.deps_progress_bar.setValue(percent)
         self.deps_progress_label.setText(message)
 
@@ -464,6 +1048,10 @@ class SettingsDockWidget(QDockWidget):
             success: True if all packages installed successfully.
             message: Summary message.
         """
+        # Drop any queued progress so it cannot overwrite the final message
+        self._progress_timer.stop()
+        self._pending_progress = None
+
         # Reset UI
         self.deps_progress_bar.setVisible(False)
         self.deps_progress_label.setText(message)
@@ -471,13 +1059,13 @@ class SettingsDockWidget(QDockWidget):
         self.refresh_deps_btn.setEnabled(True)
 
         if success:
-            self.deps_progress_label.setStyleSheet("color: green;")
+            self._set_state(self.deps_progress_label, "success")
             self.iface.messageBar().pushSuccess(
                 "NASA Earthdata", "Dependencies installed successfully!"
             )
             self.deps_installed.emit()
         else:
-            self.deps_progress_label.setStyleSheet("color: red;")
+            self._set_state(self.deps_progress_label, "error")
             self.install_deps_btn.setEnabled(True)
 
         # Refresh status display
@@ -497,19 +1085,37 @@ class SettingsDockWidget(QDockWidget):
 
     def _browse_download_dir(self):
         """Open directory browser for download directory."""
-        dir_path = QFileDialog.getExistingDirectory(
-            self, "Select Download Directory", self.download_dir_input.text() or ""
+        self._browse_dir(
+            self.download_dir_input, "Select Download Directory", "download_dir"
         )
-        if dir_path:
-            self.download_dir_input.setText(dir_path)
 
     def _browse_cache_dir(self):
         """Open directory browser for cache directory."""
-        dir_path = QFileDialog.getExistingDirectory(
-            self, "Select Cache Directory", self.cache_dir_input.text() or ""
-        )
-        if dir_path:
-            self.cache_dir_input.setText(dir_path)
+        self._browse_dir(self.cache_dir_input, "Select Cache Directory", "cache_dir")
+
+    def _browse_dir(self, target, title, key):
+        """Let the user pick a directory and write it into a line edit.
+
+        One directory dialog is created on first use and kept on the dock,
+        so later browses skip the native dialog setup.
+
+        Args:
+            target: QLineEdit that holds the selected directory path.
+            title: Caption for the directory dialog.
+            key: Setting key stored in ``target``.
+        """
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self)
+            self._dir_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+
+        dialog = self._dir_dialog
+        dialog.setWindowTitle(title)
+        dialog.setDirectory(target.text().strip() or QDir.homePath())
+        exec_dialog = getattr(dialog, "exec", None) or getattr(dialog, "exec_", None)
+        if exec_dialog() and dialog.selectedFiles():
+            target.setText(dialog.selectedFiles()[0])
+            self._schedule_save(key)
 
     def _test_credentials(self):
         """Test NASA Earthdata credentials."""
@@ -518,137 +1124,173 @@ class SettingsDockWidget(QDockWidget):
 
         if not username or not password:
             self.creds_status_label.setText("Please enter username and password")
-            self.creds_status_label.setStyleSheet(self._text_style("warning"))
+            self._set_state(self.creds_status_label, "warning")
             return
 
-        self.creds_status_label.setText("Testing credentials...")
-        self.creds_status_label.setStyleSheet(self._text_style("info"))
-
-        try:
-            from ..core.venv_manager import import_earthaccess
+        if self._creds_test_worker is not None and self._creds_test_worker.isRunning():
+            return
 
-            earthaccess = import_earthaccess()
+        self.test_creds_btn.setEnabled(False)
+        self.creds_status_label.setText("Testing credentials...")
+        self._set_state(self.creds_status_label, "info")
 
-            # Set environment variables for earthaccess
-            os.environ["EARTHDATA_USERNAME"] = username
-            os.environ["EARTHDATA_PASSWORD"] = password
+        # The login is a network round-trip, so run it off the GUI thread.
+        self._creds_test_worker = CredentialsTestWorker(username, password)
+        self._creds_test_worker.finished.connect(self._on_credentials_tested)
+        self._creds_test_worker.start()
 
-            # Try to authenticate (persist=True writes to .netrc as well)
-            auth = earthaccess.login(strategy="environment", persist=True)
+    def _on_credentials_tested(self, authenticated, error):
+        """Show the credential test result and save valid credentials.
 
-            if auth.authenticated:
+        Args:
+            authenticated: True if the Earthdata login succeeded.
+            error: Status text to show when it did not.
+        """
+        worker = self._creds_test_worker
+        try:
+            self.test_creds_btn.setEnabled(True)
+            if not authenticated:
+                self.creds_status_label.setText(error)
+                self._set_state(self.creds_status_label, "error")
+                return
+
+            # Export the verified credentials for earthaccess' environment
+            # strategy, then persist them; both happen on the GUI thread.
+            os.environ["EARTHDATA_USERNAME"] = worker.username
+            os.environ["EARTHDATA_PASSWORD"] = worker.password
+            try:
                 # Save credentials to .netrc file for persistent authentication
-                self._save_netrc(username, password)
-                self.creds_status_label.setText("✓ Credentials valid! Saved to .netrc")
-                self.creds_status_label.setStyleSheet(
-                    self._text_style("success", bold=True)
-                )
-                # Update netrc status
-                self._check_netrc()
-            else:
-                self.creds_status_label.setText("✗ Authentication failed")
-                self.creds_status_label.setStyleSheet(self._text_style("error"))
-
-        except ImportError as e:
-            self.creds_status_label.setText(str(e)[:200])
-            self.creds_status_label.setStyleSheet(self._text_style("error"))
-        except Exception as e:
-            self.creds_status_label.setText(f"Error: {str(e)[:50]}")
-            self.creds_status_label.setStyleSheet(self._text_style("error"))
+                self._save_netrc(worker.username, worker.password)
+            except Exception as e:
+                self.creds_status_label.setText(f"Error: {str(e)[:50]}")
+                self._set_state(self.creds_status_label, "error")
+                return
+
+            self.creds_status_label.setText("✓ Credentials valid! Saved to .netrc")
+            self._set_state(self.creds_status_label, "success", strong=True)
+            # Update netrc status
+            self._check_netrc()
+        except RuntimeError:
+            # The dock was deleted (plugin unload) before the login finished.
+            pass  # nosec B110
+
+    @staticmethod
+    def _netrc_file_key():
+        """Return (path, inode, mtime, size) identifying the current ~/.netrc."""
+        st = os.stat(NETRC_PATH)
+        return (str(NETRC_PATH), st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _load_netrc(cls):
+        """Return the parsed ~/.netrc, re-reading it only when the file changed.
+
+        Raises:
+            FileNotFoundError: If ~/.netrc does not exist.
+            netrc.NetrcParseError: If the file cannot be parsed.
+        """
+        key = cls._netrc_file_key()
+        cached = SettingsDockWidget._netrc_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        auths = netrc.netrc(str(NETRC_PATH))
+        SettingsDockWidget._netrc_cache = (key, auths)
+        return auths
 
     def _save_netrc(self, username, password):
         """Save NASA Earthdata credentials to .netrc file."""
-        netrc_path = Path.home() / ".netrc"
-        earthdata_host = "urs.earthdata.nasa.gov"
+        # Start from the existing entries so other machines are preserved.
+        # An unchanged file is served from the parse cache without a re-read.
+        auths = None
+        try:
+            auths = SettingsDockWidget._load_netrc()
+        except FileNotFoundError:
+            auths = netrc.netrc(os.devnull)
+        except netrc.NetrcParseError:
+            # The stdlib parser is stricter than most .netrc readers; fall
+            # back to swapping the Earthdata block in the raw text.
+            pass  # nosec B110
+        except OSError as e:
+            raise Exception(f"Failed to save .netrc: {e}")
 
-        # Read existing .netrc content if it exists
-        existing_content = ""
-        if netrc_path.exists():
+        if auths is not None:
+            auths.hosts[EARTHDATA_HOST] = (username, "", password)
+            content = _format_netrc(auths)
+        else:
             try:
-                with open(netrc_path, "r") as f:
-                    existing_content = f.read()
-            except Exception:
-                pass  # nosec B110
-
-        # Parse existing entries, excluding any existing earthdata entry
-        lines = existing_content.strip().split("\n") if existing_content.strip() else []
-        new_lines = []
-        skip_until_next_machine = False
-
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("machine"):
-                # Check if this is the earthdata entry
-                if earthdata_host in stripped:
-                    skip_until_next_machine = True
-                    continue
-                else:
-                    skip_until_next_machine = False
-
-            if not skip_until_next_machine:
-                new_lines.append(line)
-
-        # Add new earthdata entry
-        earthdata_entry = f"\nmachine {earthdata_host}\n    login {username}\n    password {password}\n"
-
-        # Write the updated .netrc file
+                existing = NETRC_PATH.read_text()
+            except OSError as e:
+                raise Exception(f"Failed to save .netrc: {e}")
+            content = _replace_netrc_entry(existing, EARTHDATA_HOST, username, password)
+
+        # Write to a temp file next to .netrc and rename it into place, so a
+        # crash mid-write never leaves a truncated .netrc behind. Resolve
+        # the path first so a symlinked ~/.netrc keeps pointing at its target.
+        target = NETRC_PATH.resolve()
+        tmp_path = None
         try:
-            with open(netrc_path, "w") as f:
-                if new_lines:
-                    f.write("\n".join(new_lines))
-                f.write(earthdata_entry)
-
-            # Set proper permissions (readable/writable only by owner)
-            if platform.system() != "Windows":
-                import stat
-
-                os.chmod(netrc_path, stat.S_IRUSR | stat.S_IWUSR)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                dir=target.parent,
+                prefix=".netrc.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                tmp_path = tmp.name
+                # Restrict permissions (readable/writable only by owner)
+                # before any credentials reach the file.
+                if platform.system() != "Windows":
+                    os.fchmod(tmp.fileno(), NETRC_MODE)
+                tmp.write(content)
+
+            os.replace(tmp_path, target)
+            # Remember what was just written so the next status check or
+            # credential lookup does not parse the file again.
+            SettingsDockWidget._netrc_cache = (
+                (SettingsDockWidget._netrc_file_key(), auths)
+                if auths is not None
+                else None
+            )
 
         except Exception as e:
+            # The cached parse now holds the unsaved entry; drop it.
+            SettingsDockWidget._netrc_cache = None
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass  # nosec B110
             raise Exception(f"Failed to save .netrc: {e}")
 
     def _check_netrc(self):
         """Check if .netrc file exists and contains Earthdata credentials."""
-        netrc_path = Path.home() / ".netrc"
-
-        if not netrc_path.exists():
-            self.netrc_status_label.setText("✗ .netrc file not found")
-            self.netrc_status_label.setStyleSheet(self._text_style("warning"))
-            return
-
+        # _load_netrc reuses the cached parse while the file is unchanged, so
+        # repeated checks cost a single stat() call.
         try:
-            import netrc
-
-            auths = netrc.netrc(str(netrc_path))
-            earthdata_auth = auths.authenticators("urs.earthdata.nasa.gov")
+            auths = self._load_netrc()
+            earthdata_auth = auths.authenticators(EARTHDATA_HOST)
 
             if earthdata_auth:
                 username = earthdata_auth[0]
                 self.netrc_status_label.setText(
                     f"✓ Found Earthdata credentials for: {username}"
                 )
-                self.netrc_status_label.setStyleSheet(
-                    self._text_style("success", bold=True)
-                )
+                self._set_state(self.netrc_status_label, "success", strong=True)
             else:
                 self.netrc_status_label.setText("✗ No Earthdata credentials in .netrc")
-                self.netrc_status_label.setStyleSheet(self._text_style("warning"))
+                self._set_state(self.netrc_status_label, "warning")
 
+        except FileNotFoundError:
+            self.netrc_status_label.setText("✗ .netrc file not found")
+            self._set_state(self.netrc_status_label, "warning")
         except Exception as e:
             self.netrc_status_label.setText(f"Error reading .netrc: {str(e)[:30]}")
-            self.netrc_status_label.setStyleSheet(self._text_style("error"))
+            self._set_state(self.netrc_status_label, "error")
 
     def _get_netrc_earthdata_credentials(self):
         """Return Earthdata credentials from ~/.netrc if available."""
-        netrc_path = Path.home() / ".netrc"
-        if not netrc_path.exists():
-            return None, None
-
         try:
-            import netrc
-
-            auths = netrc.netrc(str(netrc_path))
-            earthdata_auth = auths.authenticators("urs.earthdata.nasa.gov")
+            auths = self._load_netrc()
+            earthdata_auth = auths.authenticators(EARTHDATA_HOST)
             if not earthdata_auth:
                 return None, None
 
@@ -682,20 +1324,41 @@ class SettingsDockWidget(QDockWidget):
             QMessageBox.StandardButton.No,
         )
 
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                import shutil
+        if reply != QMessageBox.StandardButton.Yes:
+            return
 
-                shutil.rmtree(cache_dir)
-                os.makedirs(cache_dir)
-                QMessageBox.information(
-                    self, "Clear Cache", "Cache cleared successfully!"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to clear cache:\n{e}")
+        if (
+            self._cache_clear_worker is not None
+            and self._cache_clear_worker.isRunning()
+        ):
+            return
+
+        self.clear_cache_btn.setEnabled(False)
+        self.clear_cache_progress.setVisible(True)
+        self._cache_clear_worker = CacheClearWorker(cache_dir)
+        self._cache_clear_worker.finished.connect(self._on_cache_cleared)
+        self._cache_clear_worker.start()
+
+    def _on_cache_cleared(self, success, error_msg):
+        """Handle completion of the background cache clear."""
+        self.clear_cache_btn.setEnabled(True)
+        self.clear_cache_progress.setVisible(False)
+        if success:
+            QMessageBox.information(self, "Clear Cache", "Cache cleared successfully!")
+        else:
+            QMessageBox.critical(self, "Error", f"Failed to clear cache:\n{error_msg}")
 
     def _load_settings(self):
-        """Load settings from QSettings."""
+        """Load settings from QSettings into the tabs built so far."""
+        for index, loader in self._tab_loaders.items():
+            if self._is_tab_built(index):
+                loader()
+
+        self.status_label.setText("Settings loaded")
+        self._set_state(self.status_label, "muted")
+
+    def _load_credentials_settings(self):
+        """Load credentials into the Credentials tab."""
         # Credentials precedence: .netrc -> environment -> QSettings username
         username = ""
         password = ""  # nosec B105
@@ -714,9 +1377,7 @@ class SettingsDockWidget(QDockWidget):
                 password = env_password
                 source = "environment"
             else:
-                username = self.settings.value(
-                    f"{self.SETTINGS_PREFIX}username", "", type=str
-                )
+                username = self._setting("username", "")
                 source = "saved settings"
 
         self.username_input.setText(username)
@@ -727,126 +1388,162 @@ class SettingsDockWidget(QDockWidget):
             self.creds_status_label.setText(
                 "Using credentials from ~/.netrc (preferred)"
             )
-            self.creds_status_label.setStyleSheet(self._text_style("success"))
+            self._set_state(self.creds_status_label, "success")
         elif source == "environment":
             self.creds_status_label.setText(
                 "Using credentials from EARTHDATA_USERNAME/EARTHDATA_PASSWORD"
             )
-            self.creds_status_label.setStyleSheet(self._text_style("success"))
+            self._set_state(self.creds_status_label, "success")
 
-        # General
-        self.download_dir_input.setText(
-            self.settings.value(f"{self.SETTINGS_PREFIX}download_dir", "", type=str)
-        )
-        self.download_threads_spin.setValue(
-            self.settings.value(f"{self.SETTINGS_PREFIX}download_threads", 4, type=int)
-        )
-        self.default_max_items_spin.setValue(
-            self.settings.value(
-                f"{self.SETTINGS_PREFIX}default_max_items", 50, type=int
-            )
-        )
-        self.auto_zoom_check.setChecked(
-            self.settings.value(f"{self.SETTINGS_PREFIX}auto_zoom", True, type=bool)
-        )
-        self.notifications_check.setChecked(
-            self.settings.value(f"{self.SETTINGS_PREFIX}notifications", True, type=bool)
-        )
+    def _load_general_settings(self):
+        """Load settings into the General tab."""
+        self._load_fields(self.GENERAL_TAB)
 
-        # Advanced
-        self.catalog_url_input.setText(
-            self.settings.value(
-                f"{self.SETTINGS_PREFIX}catalog_url",
-                "https://github.com/opengeos/NASA-Earth-Data/raw/main/nasa_earth_data.tsv",
-                type=str,
-            )
-        )
-        self.enable_cache_check.setChecked(
-            self.settings.value(f"{self.SETTINGS_PREFIX}enable_cache", True, type=bool)
-        )
-        self.cache_dir_input.setText(
-            self.settings.value(f"{self.SETTINGS_PREFIX}cache_dir", "", type=str)
-        )
-        self.debug_check.setChecked(
-            self.settings.value(f"{self.SETTINGS_PREFIX}debug", False, type=bool)
-        )
+    def _load_advanced_settings(self):
+        """Load settings into the Advanced tab."""
+        self._load_fields(self.ADVANCED_TAB)
 
-        self.status_label.setText("Settings loaded")
-        self.status_label.setStyleSheet("color: gray; font-size: 10px;")
+    def _field_widgets(self, index, accessor):
+        """Yield (key, bound accessor) for each settings field of a tab.
+
+        Args:
+            index: Tab index in SETTINGS_FIELDS.
+            accessor: FieldAccessor field name: "setter", "getter", or "signal".
+        """
+        for key, attr, kind in self.SETTINGS_FIELDS[index]:
+            name = getattr(self.FIELD_ACCESSORS[kind], accessor)
+            yield key, getattr(getattr(self, attr), name)
+
+    def _load_fields(self, index):
+        """Set a tab's widgets from one fresh read of the settings group."""
+        values = self._read_settings()
+        for key, setter in self._field_widgets(index, "setter"):
+            setter(self._coerce_setting(values.get(key), DEFAULTS.get(key, "")))
+
+    def _field_values(self, index):
+        """Return a tab's settings read from its widgets."""
+        return {key: getter() for key, getter in self._field_widgets(index, "getter")}
 
     def _save_settings(self):
-        """Save settings to QSettings."""
-        # Credentials
+        """Save settings from the tabs built so far to QSettings."""
+        self._save_timer.stop()
+        self._dirty_keys.clear()
+        self._unsaved_defaults = False
+        values = {}
+        credentials_saved = False
+        if self._is_tab_built(self.CREDENTIALS_TAB):
+            credentials, credentials_saved = self._save_credentials_settings()
+            values.update(credentials)
+        values.update(self._stage_values())
+
+        # Rewriting ~/.netrc counts as a change even when QSettings is unchanged.
+        changed = self._write_settings(values) or credentials_saved
+        if self._is_tab_built(self.CREDENTIALS_TAB):
+            self._check_netrc()
+
+        if not changed:
+            self.status_label.setText("No changes to save")
+            self._set_state(self.status_label, "muted")
+            return
+
+        self.status_label.setText("Settings saved")
+        self._set_state(self.status_label, "success")
+
+        self.iface.messageBar().pushSuccess(
+            "NASA Earthdata", "Settings saved successfully!"
+        )
+
+    def _stage_values(self):
+        """Return the General/Advanced settings from the tabs built so far."""
+        values = {}
+        for index in self.SETTINGS_FIELDS:
+            if self._is_tab_built(index):
+                values.update(self._field_values(index))
+        return values
+
+    def _flush_to_qsettings(self):
+        """Write pending General/Advanced edits (the debounced auto-save).
+
+        Only fields edited since the last save are written, so defaults
+        restored but not saved stay unsaved when another field is edited.
+        """
+        self._save_timer.stop()
+        values = self._stage_values()
+        edited = {key: values[key] for key in self._dirty_keys if key in values}
+        self._dirty_keys.clear()
+        if self._write_settings(edited):
+            self.status_label.setText("Settings saved")
+            self._set_state(self.status_label, "success")
+
+    def showEvent(self, event):
+        """Reload built General/Advanced tabs when the dock is shown again.
+
+        Other modules may have changed keys such as ``download_dir`` while
+        the dock was hidden; pending edits and restored-but-unsaved defaults
+        are left alone.
+        """
+        super().showEvent(event)
+        if self._save_timer.isActive() or self._unsaved_defaults:
+            return
+        for index in self.SETTINGS_FIELDS:
+            if self._is_tab_built(index):
+                self._load_fields(index)
+        # Reloading is not an edit; drop the auto-save it triggered.
+        self._save_timer.stop()
+        self._dirty_keys.clear()
+
+    def changeEvent(self, event):
+        """Switch to the light/dark stylesheet when the palette changes."""
+        super().changeEvent(event)
+        if event.type() in (
+            QEvent.Type.PaletteChange,
+            QEvent.Type.ApplicationPaletteChange,
+        ):
+            sheet = self._dock_stylesheet()
+            # Only restyle on an actual theme flip; setStyleSheet itself can
+            # post another palette change.
+            if sheet != self.styleSheet():
+                self.setStyleSheet(sheet)
+
+    def closeEvent(self, event):
+        """Write any pending auto-save before the dock closes."""
+        if self._save_timer.isActive():
+            self._flush_to_qsettings()
+        super().closeEvent(event)
+
+    def _save_credentials_settings(self):
+        """Persist credentials to ~/.netrc and return Credentials tab settings.
+
+        Returns:
+            Tuple of (settings to write to QSettings, whether ~/.netrc was saved).
+        """
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
 
-        self.settings.setValue(f"{self.SETTINGS_PREFIX}username", username)
-
         # Set environment variables for earthaccess
         if username:
             os.environ["EARTHDATA_USERNAME"] = username
         if password:
             os.environ["EARTHDATA_PASSWORD"] = password
+        netrc_saved = False
         if username and password:
             try:
                 self._save_netrc(username, password)
+                netrc_saved = True
                 self.creds_status_label.setText(
                     "✓ Credentials saved to ~/.netrc and environment"
                 )
-                self.creds_status_label.setStyleSheet(
-                    self._text_style("success", bold=True)
-                )
+                self._set_state(self.creds_status_label, "success", strong=True)
             except Exception as e:
                 self.creds_status_label.setText(f"Failed to save .netrc: {str(e)[:50]}")
-                self.creds_status_label.setStyleSheet(self._text_style("error"))
+                self._set_state(self.creds_status_label, "error")
         elif username:
             self.creds_status_label.setText(
                 "Username saved. Enter password and Save to persist to ~/.netrc"
             )
-            self.creds_status_label.setStyleSheet(self._text_style("warning"))
+            self._set_state(self.creds_status_label, "warning")
 
-        # General
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}download_dir", self.download_dir_input.text()
-        )
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}download_threads",
-            self.download_threads_spin.value(),
-        )
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}default_max_items",
-            self.default_max_items_spin.value(),
-        )
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}auto_zoom", self.auto_zoom_check.isChecked()
-        )
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}notifications", self.notifications_check.isChecked()
-        )
-
-        # Advanced
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}catalog_url", self.catalog_url_input.text()
-        )
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}enable_cache", self.enable_cache_check.isChecked()
-        )
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}cache_dir", self.cache_dir_input.text()
-        )
-        self.settings.setValue(
-            f"{self.SETTINGS_PREFIX}debug", self.debug_check.isChecked()
-        )
-
-        self.settings.sync()
-        self._check_netrc()
-
-        self.status_label.setText("Settings saved")
-        self.status_label.setStyleSheet("color: green; font-size: 10px;")
-
-        self.iface.messageBar().pushSuccess(
-            "NASA Earthdata", "Settings saved successfully!"
-        )
+        return {"username": username}, netrc_saved
 
     def _reset_defaults(self):
         """Reset all settings to defaults."""
@@ -861,24 +1558,20 @@ class SettingsDockWidget(QDockWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
+        self._build_all_tabs()
+
         # Credentials
         self.username_input.clear()
         self.password_input.clear()
 
-        # General
-        self.download_dir_input.clear()
-        self.download_threads_spin.setValue(4)
-        self.default_max_items_spin.setValue(50)
-        self.auto_zoom_check.setChecked(True)
-        self.notifications_check.setChecked(True)
-
-        # Advanced
-        self.catalog_url_input.setText(
-            "https://github.com/opengeos/NASA-Earth-Data/raw/main/nasa_earth_data.tsv"
-        )
-        self.enable_cache_check.setChecked(True)
-        self.cache_dir_input.clear()
-        self.debug_check.setChecked(False)
+        # General and Advanced
+        for index in self.SETTINGS_FIELDS:
+            for key, setter in self._field_widgets(index, "setter"):
+                setter(DEFAULTS.get(key, ""))
+        # The resets above are not user edits; keep them unsaved until Save.
+        self._save_timer.stop()
+        self._dirty_keys.clear()
+        self._unsaved_defaults = True
 
         self.status_label.setText("Defaults restored (not saved)")
-        self.status_label.setStyleSheet("color: orange; font-size: 10px;")
+        self._set_state(self.status_label, "warning")
@@ -5,8 +5,10 @@ This module contains the main plugin class that manages the QGIS interface
 integration, menu items, toolbar buttons, and dockable panels.
 """
 
+import importlib
 import os
 import sys
+from functools import lru_cache, partial
 
 from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QIcon
@@ -15,11 +17,85 @@ from qgis.PyQt.QtWidgets import QAction, QMenu, QToolBar, QMessageBox
 OPEN_GEOAGENT_PLUGIN_CANDIDATES = ("open_geoagent",)
 TOOLBAR_OBJECT_NAME = "NASAEarthdataToolbar"
 MENU_TITLE = "&NASA Earthdata"
+# Bundled icon file names and the QGIS theme icon used when one is missing.
+ICON_FALLBACKS = {
+    "icon.svg": ":/images/themes/default/mActionAddRasterLayer.svg",
+    "settings.svg": ":/images/themes/default/mActionOptions.svg",
+    "about.svg": ":/images/themes/default/mActionHelpContents.svg",
+    "ai_chat.svg": ":/images/themes/default/mActionHelpContents.svg",
+}
+
+ABOUT_TEMPLATE = """
+<h2>NASA Earthdata Plugin for QGIS</h2>
+<p>Version: {version}</p>
+<p>Author: Qiusheng Wu</p>
+
+<h3>Features:</h3>
+<ul>
+<li><b>Search:</b> Search NASA Earthdata catalog with keywords, bounding box, and temporal filters</li>
+<li><b>Visualize:</b> Display Cloud Optimized GeoTIFFs (COG) directly in QGIS</li>
+<li><b>Footprints:</b> Show data footprints on the map</li>
+<li><b>Download:</b> Download data products for local use</li>
+</ul>
+
+<h3>Requirements:</h3>
+<ul>
+<li>NASA Earthdata account - <a href="https://urs.earthdata.nasa.gov/">Register here</a></li>
+<li>Python packages: earthaccess, geopandas</li>
+</ul>
+
+<h3>Links:</h3>
+<ul>
+<li><a href="https://github.com/opengeos/qgis-nasa-earthdata-plugin">GitHub Repository</a></li>
+<li><a href="https://github.com/opengeos/qgis-nasa-earthdata-plugin/issues">Report Issues</a></li>
+</ul>
+
+<p>Licensed under MIT License</p>
+"""
+
+
+@lru_cache(maxsize=32)
+def _icon(icon_path):
+    """Return a shared QIcon for ``icon_path``.
+
+    Icons are cached per path so unload/reload cycles and repeated
+    ``initGui`` calls reuse the already decoded SVGs.
+    """
+    return QIcon(icon_path)
 
 
 class NASAEarthdata:
     """NASA Earthdata Plugin implementation class for QGIS."""
 
+    # About dialog HTML, rendered once the version is known.
+    _about_html = None
+
+    # Lazily created dock widgets: instance attribute, checkable action,
+    # dock class location, object name, error title and first-open hook.
+    DOCKS = {
+        "earthdata": {
+            "attr": "_earthdata_dock",
+            "action": "earthdata_action",
+            "module": ".dialogs.earthdata_dock",
+            "class": "EarthdataDockWidget",
+            "object_name": "NASAEarthdataDock",
+            "title": "NASA Earthdata panel",
+            "on_first_open": "_check_dependencies_on_open",
+        },
+        "settings": {
+            "attr": "_settings_dock",
+            "action": "settings_action",
+            "module": ".dialogs.settings_dock",
+            "class": "SettingsDockWidget",
+            "object_name": "NASAEarthdataSettingsDock",
+            "title": "Settings panel",
+            "on_first_open": None,
+        },
+    }
+
+    # Dock widget classes by DOCKS key, resolved on first use.
+    _dock_classes = {}
+
     def __init__(self, iface):
         """Constructor.
 
@@ -28,6 +104,8 @@ class NASAEarthdata:
         """
         self.iface = iface
         self.plugin_dir = os.path.dirname(__file__)
+        self._icons_dir = os.path.join(self.plugin_dir, "icons")
+        self._metadata_path = os.path.join(self.plugin_dir, "metadata.txt")
         self.actions = []
         self.menu = None
         self.toolbar = None
@@ -35,7 +113,9 @@ class NASAEarthdata:
         # Dock widgets (lazy loaded)
         self._earthdata_dock = None
         self._settings_dock = None
+        self._visibility_slots = {}
         self._deps_signal_connected = False
+        self._deps_check_worker = None
         self._processing_provider = None
         try:
             setattr(self.iface, "_nasa_earthdata_plugin", self)
@@ -48,21 +128,20 @@ class NASAEarthdata:
         text,
         callback,
         enabled_flag=True,
-        add_to_menu=True,
-        add_to_toolbar=True,
         status_tip=None,
         checkable=False,
         parent=None,
     ):
-        """Add a toolbar icon to the toolbar.
+        """Create a plugin action.
+
+        The caller places the action on the toolbar and/or menu, so that
+        ``initGui`` can add each container's actions in a single batch.
 
         Args:
             icon_path: Path to the icon for this action.
             text: Text that appears in the menu for this action.
             callback: Function to be called when the action is triggered.
             enabled_flag: A flag indicating if the action should be enabled.
-            add_to_menu: Flag indicating whether action should be added to menu.
-            add_to_toolbar: Flag indicating whether action should be added to toolbar.
             status_tip: Optional text to show in status bar when mouse hovers over action.
             checkable: Whether the action is checkable (toggle).
             parent: Parent widget for the new action.
@@ -70,8 +149,7 @@ class NASAEarthdata:
         Returns:
             The action that was created.
         """
-        icon = QIcon(icon_path)
-        action = QAction(icon, text, parent)
+        action = QAction(_icon(icon_path), text, parent)
         action.triggered.connect(callback)
         action.setEnabled(enabled_flag)
         action.setCheckable(checkable)
@@ -79,12 +157,6 @@ class NASAEarthdata:
         if status_tip is not None:
             action.setStatusTip(status_tip)
 
-        if add_to_toolbar:
-            self.toolbar.addAction(action)
-
-        if add_to_menu:
-            self.menu.addAction(action)
-
         self.actions.append(action)
 
         return action
@@ -94,34 +166,17 @@ class NASAEarthdata:
         self._remove_toolbars_by_object_name()
         self._remove_menus_by_title()
 
-        # Create menu
+        # Create menu and toolbar
         self.menu = QMenu(MENU_TITLE)
-        self.iface.mainWindow().menuBar().addMenu(self.menu)
-
-        # Create toolbar
         self.toolbar = QToolBar("NASA Earthdata Toolbar")
         self.toolbar.setObjectName(TOOLBAR_OBJECT_NAME)
-        self.iface.addToolBar(self.toolbar)
 
         # Get icon paths
-        icon_base = os.path.join(self.plugin_dir, "icons")
-
-        # Main panel icon
-        main_icon = os.path.join(icon_base, "icon.svg")
-        if not os.path.exists(main_icon):
-            main_icon = ":/images/themes/default/mActionAddRasterLayer.svg"
-
-        settings_icon = os.path.join(icon_base, "settings.svg")
-        if not os.path.exists(settings_icon):
-            settings_icon = ":/images/themes/default/mActionOptions.svg"
-
-        about_icon = os.path.join(icon_base, "about.svg")
-        if not os.path.exists(about_icon):
-            about_icon = ":/images/themes/default/mActionHelpContents.svg"
+        icons = self._icon_paths()
 
         # Add NASA Earthdata Panel action (checkable for dock toggle)
         self.earthdata_action = self.add_action(
-            main_icon,
+            icons["icon.svg"],
             "NASA Earthdata Search",
             self.toggle_earthdata_dock,
             status_tip="Search and visualize NASA Earthdata",
@@ -129,22 +184,17 @@ class NASAEarthdata:
             parent=self.iface.mainWindow(),
         )
 
-        ai_icon = os.path.join(icon_base, "ai_chat.svg")
-        if not os.path.exists(ai_icon):
-            ai_icon = ":/images/themes/default/mActionHelpContents.svg"
-
         self.ai_chat_action = self.add_action(
-            ai_icon,
+            icons["ai_chat.svg"],
             "AI Assistant",
             self.open_ai_assistant,
-            add_to_toolbar=False,
             status_tip="Open the OpenGeoAgent chat panel",
             parent=self.iface.mainWindow(),
         )
 
         # Add Settings Panel action (checkable for dock toggle)
         self.settings_action = self.add_action(
-            settings_icon,
+            icons["settings.svg"],
             "Settings",
             self.toggle_settings_dock,
             status_tip="Configure NASA Earthdata settings",
@@ -152,34 +202,54 @@ class NASAEarthdata:
             parent=self.iface.mainWindow(),
         )
 
-        # Add separator to menu
-        self.menu.addSeparator()
-
         # Update icon - use QGIS default download/update icon
         update_icon = ":/images/themes/default/mActionRefresh.svg"
 
         # Add Check for Updates action (menu only)
-        self.add_action(
+        update_action = self.add_action(
             update_icon,
             "Check for Updates...",
             self.show_update_checker,
-            add_to_toolbar=False,
             status_tip="Check for plugin updates from GitHub",
             parent=self.iface.mainWindow(),
         )
 
         # Add About action (menu only)
-        self.add_action(
-            about_icon,
+        about_action = self.add_action(
+            icons["about.svg"],
             "About NASA Earthdata Plugin",
             self.show_about,
-            add_to_toolbar=False,
             status_tip="About NASA Earthdata Plugin",
             parent=self.iface.mainWindow(),
         )
 
+        # Populate each container in one batch, then attach it to QGIS
+        self.toolbar.addActions([self.earthdata_action, self.settings_action])
+        self.menu.addActions(
+            [self.earthdata_action, self.ai_chat_action, self.settings_action]
+        )
+        self.menu.addSeparator()
+        self.menu.addActions([update_action, about_action])
+        self.iface.mainWindow().menuBar().addMenu(self.menu)
+        self.iface.addToolBar(self.toolbar)
+
         self._register_processing_provider()
 
+    def _icon_paths(self):
+        """Map each ICON_FALLBACKS name to its bundled file or theme fallback.
+
+        The icons directory is listed once instead of stat-ing every file.
+        """
+        try:
+            with os.scandir(self._icons_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        return {
+            name: os.path.join(self._icons_dir, name) if name in present else fallback
+            for name, fallback in ICON_FALLBACKS.items()
+        }
+
     def _remove_toolbar(self, toolbar):
         """Detach and schedule deletion of a plugin toolbar widget."""
         if toolbar is None:
@@ -256,25 +326,43 @@ class NASAEarthdata:
 
     def unload(self):
         """Remove the plugin menu item and icon from QGIS GUI."""
-        # Remove dock widgets
-        if self._earthdata_dock:
-            self.iface.removeDockWidget(self._earthdata_dock)
-            self._earthdata_dock.deleteLater()
-            self._earthdata_dock = None
+        # Let a pending dependency check finish without prompting
+        if self._deps_check_worker is not None:
+            try:
+                self._deps_check_worker.result.disconnect(self._on_dependencies_checked)
+                self._deps_check_worker.finished.disconnect(
+                    self._on_dependencies_check_finished
+                )
+                self._deps_check_worker.wait()
+            except (TypeError, RuntimeError):
+                pass  # nosec B110
+            self._deps_check_worker = None
 
-        if self._settings_dock:
-            self.iface.removeDockWidget(self._settings_dock)
-            self._settings_dock.deleteLater()
-            self._settings_dock = None
+        # Remove dock widgets, disconnecting visibility first so teardown
+        # does not call back into actions that are about to be deleted.
+        for key, spec in self.DOCKS.items():
+            dock = getattr(self, spec["attr"])
+            if not dock:
+                continue
+            slot = self._visibility_slots.pop(key, None)
+            if slot is not None:
+                try:
+                    dock.visibilityChanged.disconnect(slot)
+                except (TypeError, RuntimeError):
+                    pass  # nosec B110
+            self.iface.removeDockWidget(dock)
+            dock.deleteLater()
+            setattr(self, spec["attr"], None)
+        self._deps_signal_connected = False
 
         # Remove actions from plugin UI containers.
-        for action in self.actions:
+        actions, self.actions = self.actions, []
+        for action in actions:
             if self.toolbar:
                 self.toolbar.removeAction(action)
             if self.menu:
                 self.menu.removeAction(action)
             action.deleteLater()
-        self.actions = []
 
         # Remove toolbar
         if self.toolbar:
@@ -335,47 +423,77 @@ class NASAEarthdata:
 
     def toggle_earthdata_dock(self):
         """Toggle the NASA Earthdata dock widget visibility."""
-        if self._earthdata_dock is None:
-            try:
-                from .dialogs.earthdata_dock import EarthdataDockWidget
+        self._toggle_dock("earthdata")
 
-                self._earthdata_dock = EarthdataDockWidget(
-                    self.iface, self.iface.mainWindow()
-                )
-                self._earthdata_dock.setObjectName("NASAEarthdataDock")
-                self._earthdata_dock.visibilityChanged.connect(
-                    self._on_earthdata_visibility_changed
-                )
-                self.iface.addDockWidget(
-                    Qt.DockWidgetArea.RightDockWidgetArea, self._earthdata_dock
-                )
-                self._earthdata_dock.show()
-                self._earthdata_dock.raise_()
+    def toggle_settings_dock(self):
+        """Toggle the Settings dock widget visibility."""
+        self._toggle_dock("settings")
 
-                # Check dependencies on first open
-                self._check_dependencies_on_open()
-                self._connect_deps_signal()
-                return
+    def _toggle_dock(self, key):
+        """Create the dock for ``key`` on first use, otherwise toggle it.
 
-            except Exception as e:
-                QMessageBox.critical(
-                    self.iface.mainWindow(),
-                    "Error",
-                    f"Failed to create NASA Earthdata panel:\n{str(e)}",
-                )
-                self.earthdata_action.setChecked(False)
+        Args:
+            key: Name of the dock in ``DOCKS``.
+        """
+        spec = self.DOCKS[key]
+        dock = getattr(self, spec["attr"])
+        if dock is None:
+            dock = self._ensure_dock(key)
+            if dock is None:
+                getattr(self, spec["action"]).setChecked(False)
                 return
+            dock.show()
+            dock.raise_()
+            if spec["on_first_open"]:
+                getattr(self, spec["on_first_open"])()
+            return
 
         # Toggle visibility
-        if self._earthdata_dock.isVisible():
-            self._earthdata_dock.hide()
+        if dock.isVisible():
+            dock.hide()
         else:
-            self._earthdata_dock.show()
-            self._earthdata_dock.raise_()
+            dock.show()
+            dock.raise_()
+
+    def _ensure_dock(self, key):
+        """Return the dock widget for ``key``, creating it on first use.
+
+        Args:
+            key: Name of the dock in ``DOCKS``.
 
-    def _on_earthdata_visibility_changed(self, visible):
-        """Handle NASA Earthdata dock visibility change."""
-        self.earthdata_action.setChecked(visible)
+        Returns:
+            The dock widget, or None if it could not be created.
+        """
+        spec = self.DOCKS[key]
+        dock = getattr(self, spec["attr"])
+        if dock is not None:
+            return dock
+        try:
+            dock_cls = NASAEarthdata._dock_classes.get(key)
+            if dock_cls is None:
+                module = importlib.import_module(spec["module"], __package__)
+                dock_cls = getattr(module, spec["class"])
+                NASAEarthdata._dock_classes[key] = dock_cls
+            dock = dock_cls(self.iface, self.iface.mainWindow())
+            dock.setObjectName(spec["object_name"])
+            slot = partial(self._on_dock_visibility_changed, key)
+            dock.visibilityChanged.connect(slot)
+            self._visibility_slots[key] = slot
+            setattr(self, spec["attr"], dock)
+            self.iface.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, dock)
+            self._connect_deps_signal()
+        except Exception as e:
+            setattr(self, spec["attr"], None)
+            QMessageBox.critical(
+                self.iface.mainWindow(),
+                "Error",
+                f"Failed to create {spec['title']}:\n{str(e)}",
+            )
+        return getattr(self, spec["attr"])
+
+    def _on_dock_visibility_changed(self, key, visible):
+        """Keep the dock's checkable action in sync with its visibility."""
+        getattr(self, self.DOCKS[key]["action"]).setChecked(visible)
 
     def open_ai_assistant(self, context=None):
         """Open the OpenGeoAgent chat panel, or prompt for plugin installation."""
@@ -539,47 +657,6 @@ class NASAEarthdata:
             "Plugins > Manage and Install Plugins...",
         )
 
-    def toggle_settings_dock(self):
-        """Toggle the Settings dock widget visibility."""
-        if self._settings_dock is None:
-            try:
-                from .dialogs.settings_dock import SettingsDockWidget
-
-                self._settings_dock = SettingsDockWidget(
-                    self.iface, self.iface.mainWindow()
-                )
-                self._settings_dock.setObjectName("NASAEarthdataSettingsDock")
-                self._settings_dock.visibilityChanged.connect(
-                    self._on_settings_visibility_changed
-                )
-                self.iface.addDockWidget(
-                    Qt.DockWidgetArea.RightDockWidgetArea, self._settings_dock
-                )
-                self._settings_dock.show()
-                self._settings_dock.raise_()
-                self._connect_deps_signal()
-                return
-
-            except Exception as e:
-                QMessageBox.critical(
-                    self.iface.mainWindow(),
-                    "Error",
-                    f"Failed to create Settings panel:\n{str(e)}",
-                )
-                self.settings_action.setChecked(False)
-                return
-
-        # Toggle visibility
-        if self._settings_dock.isVisible():
-            self._settings_dock.hide()
-        else:
-            self._settings_dock.show()
-            self._settings_dock.raise_()
-
-    def _on_settings_visibility_changed(self, visible):
-        """Handle Settings dock visibility change."""
-        self.settings_action.setChecked(visible)
-
     def _connect_deps_signal(self):
         """Connect settings dock deps_installed signal to earthdata dock reload."""
         if (
@@ -593,14 +670,43 @@ class NASAEarthdata:
             self._deps_signal_connected = True
 
     def _check_dependencies_on_open(self):
-        """Check if required dependencies are installed and prompt if missing."""
+        """Check required dependencies in the background on first dock open.
+
+        The check runs on a DepsCheckWorker thread so the dock appears
+        immediately; the prompt is shown by ``_on_dependencies_checked``.
+        """
+        if self._deps_check_worker is not None:
+            return
         try:
-            from .core.venv_manager import check_dependencies
+            from .dialogs.deps_manager import DepsCheckWorker
 
-            all_ok, missing, _installed = check_dependencies()
-            if all_ok:
-                return
+            self._deps_check_worker = DepsCheckWorker()
+            self._deps_check_worker.result.connect(self._on_dependencies_checked)
+            self._deps_check_worker.finished.connect(
+                self._on_dependencies_check_finished
+            )
+            self._deps_check_worker.start()
+        except Exception:
+            # Don't let dependency check errors prevent the dock from opening
+            self._deps_check_worker = None
+
+    def _on_dependencies_check_finished(self):
+        """Release the dependency check worker once its thread has stopped.
+
+        ``result`` arrives while ``run()`` is still returning, so the
+        reference is only dropped from QThread's own ``finished`` signal.
+        """
+        worker = self._deps_check_worker
+        if worker is None:
+            return
+        worker.wait()
+        self._deps_check_worker = None
 
+    def _on_dependencies_checked(self, all_ok, missing, _installed):
+        """Prompt to open Settings when the dependency check found gaps."""
+        if all_ok:
+            return
+        try:
             missing_names = ", ".join(name for name, _ in missing)
             reply = QMessageBox.warning(
                 self.iface.mainWindow(),
@@ -617,93 +723,58 @@ class NASAEarthdata:
                 self._open_settings_deps_tab()
 
         except Exception:
-            # Don't let dependency check errors prevent the dock from opening
             pass  # nosec B110
 
     def _open_settings_deps_tab(self):
         """Open the Settings dock and switch to the Dependencies tab."""
-        if self._settings_dock is None:
-            try:
-                from .dialogs.settings_dock import SettingsDockWidget
-
-                self._settings_dock = SettingsDockWidget(
-                    self.iface, self.iface.mainWindow()
-                )
-                self._settings_dock.setObjectName("NASAEarthdataSettingsDock")
-                self._settings_dock.visibilityChanged.connect(
-                    self._on_settings_visibility_changed
-                )
-                self.iface.addDockWidget(
-                    Qt.DockWidgetArea.RightDockWidgetArea, self._settings_dock
-                )
-                self._connect_deps_signal()
-            except Exception as e:
-                QMessageBox.critical(
-                    self.iface.mainWindow(),
-                    "Error",
-                    f"Failed to create Settings panel:\n{str(e)}",
-                )
-                return
+        dock = self._ensure_dock("settings")
+        if dock is None:
+            return
 
-        self._settings_dock.show()
-        self._settings_dock.raise_()
+        dock.show()
+        dock.raise_()
         self.settings_action.setChecked(True)
 
         # Switch to Dependencies tab
-        self._settings_dock.show_dependencies_tab()
+        dock.show_dependencies_tab()
 
     def show_about(self):
         """Display the about dialog."""
-        # Read version from metadata.txt
-        version = "Unknown"
+        # The rendered HTML is cached once the version has been read.
+        about_text = NASAEarthdata._about_html
+        if about_text is None:
+            try:
+                from ._version import __version__ as version
+            except ImportError:
+                version = self._read_metadata_version()
+
+            about_text = ABOUT_TEMPLATE.format(version=version or "Unknown")
+            if version:
+                NASAEarthdata._about_html = about_text
+        QMessageBox.about(
+            self.iface.mainWindow(),
+            "About NASA Earthdata Plugin",
+            about_text,
+        )
+
+    def _read_metadata_version(self):
+        """Read the plugin version from metadata.txt.
+
+        Returns:
+            The version string, or None if it could not be read.
+        """
         try:
-            metadata_path = os.path.join(self.plugin_dir, "metadata.txt")
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                import re
-
-                content = f.read()
-                version_match = re.search(r"^version=(.+)$", content, re.MULTILINE)
-                if version_match:
-                    version = version_match.group(1).strip()
+            with open(self._metadata_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("version="):
+                        return line[len("version=") :].strip()
         except Exception as e:
             QMessageBox.warning(
                 self.iface.mainWindow(),
                 "NASA Earthdata",
                 f"Could not read version from metadata.txt:\n{str(e)}",
             )
-
-        about_text = f"""
-<h2>NASA Earthdata Plugin for QGIS</h2>
-<p>Version: {version}</p>
-<p>Author: Qiusheng Wu</p>
-
-<h3>Features:</h3>
-<ul>
-<li><b>Search:</b> Search NASA Earthdata catalog with keywords, bounding box, and temporal filters</li>
-<li><b>Visualize:</b> Display Cloud Optimized GeoTIFFs (COG) directly in QGIS</li>
-<li><b>Footprints:</b> Show data footprints on the map</li>
-<li><b>Download:</b> Download data products for local use</li>
-</ul>
-
-<h3>Requirements:</h3>
-<ul>
-<li>NASA Earthdata account - <a href="https://urs.earthdata.nasa.gov/">Register here</a></li>
-<li>Python packages: earthaccess, geopandas</li>
-</ul>
-
-<h3>Links:</h3>
-<ul>
-<li><a href="https://github.com/opengeos/qgis-nasa-earthdata-plugin">GitHub Repository</a></li>
-<li><a href="https://github.com/opengeos/qgis-nasa-earthdata-plugin/issues">Report Issues</a></li>
-</ul>
-
-<p>Licensed under MIT License</p>
-"""
-        QMessageBox.about(
-            self.iface.mainWindow(),
-            "About NASA Earthdata Plugin",
-            about_text,
-        )
+        return None
 
     def show_update_checker(self):
         """Display the update checker dialog."""
@@ -1,3 +1,9 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from nasa_earthdata.dialogs import earthdata_dock
 from nasa_earthdata.dialogs.earthdata_dock import (
     CatalogData,
     CatalogLoadWorker,
@@ -205,3 +211,342 @@ def test_compact_result_id_preserves_start_and_end():
     compacted = _compact_result_id(result_id, prefix_chars=20, suffix_chars=12)
 
     assert compacted == "OPERA_L3_DSWx-HLS_T1...Z_L8_30_v1.0"
+
+
+def test_download_progress_logs_every_message_and_flushes_held_update(monkeypatch):
+    class FakeProgressBar:
+        def __init__(self):
+            self.values = []
+
+        def setValue(self, value):
+            self.values.append(value)
+
+    scheduled = []
+    monkeypatch.setattr(
+        earthdata_dock,
+        "QTimer",
+        SimpleNamespace(singleShot=lambda ms, callback: scheduled.append(callback)),
+    )
+    logged = []
+    statuses = []
+    dock = type(
+        "Dock",
+        (),
+        {
+            "progress_bar": FakeProgressBar(),
+            "_last_progress_ts": 0.0,
+            "_pending_progress": None,
+            "_progress_flush_pending": False,
+            "_log": lambda self, message, error=False, status=True: logged.append(
+                message
+            ),
+            "_set_status": lambda self, message, error=False: statuses.append(message),
+            "_show_download_progress": EarthdataDockWidget._show_download_progress,
+            "_flush_download_progress": EarthdataDockWidget._flush_download_progress,
+        },
+    )()
+
+    EarthdataDockWidget._on_download_progress(dock, 5, "Preparing download queue...")
+    EarthdataDockWidget._on_download_progress(dock, 5, "Downloading 1/2: a")
+    EarthdataDockWidget._on_download_progress(dock, 10, "Downloading 1/2: a (10%)")
+    assert logged == [
+        "Preparing download queue...",
+        "Downloading 1/2: a",
+        "Downloading 1/2: a (10%)",
+    ]
+    assert dock.progress_bar.values == [5]
+    assert len(scheduled) == 1
+
+    # The trailing refresh shows the last held-back update.
+    scheduled.pop()()
+    assert dock.progress_bar.values == [5, 10]
+    assert statuses[-1] == "Downloading 1/2: a (10%)"
+    assert dock._pending_progress is None
+
+    EarthdataDockWidget._on_download_progress(dock, 100, "done")
+    assert dock.progress_bar.values == [5, 10, 100]
+    assert logged[-1] == "done" and statuses[-1] == "done"
+    assert scheduled == []
+
+
+def test_cog_results_cluster_by_source_host():
+    results = [
+        (
+            "b.tif",
+            "/vsicurl/https://b.example.test/b.tif",
+            "https://b.example.test/b.tif",
+        ),
+        (
+            "a2.tif",
+            "/vsicurl/https://a.example.test/2.tif",
+            "https://a.example.test/2.tif",
+        ),
+        (
+            "a1.tif",
+            "/vsicurl/https://a.example.test/1.tif",
+            "https://a.example.test/1.tif",
+        ),
+    ]
+
+    ordered = sorted(results, key=EarthdataDockWidget._cog_result_sort_key)
+
+    assert [item[0] for item in ordered] == ["a1.tif", "a2.tif", "b.tif"]
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self):
+        return self.body
+
+
+def test_catalog_load_worker_drops_result_when_interrupted(tmp_path, monkeypatch):
+    interrupted = []
+
+    def urlopen(url, timeout):
+        interrupted.append(url)
+        return FakeResponse(b"ShortName\tEntryTitle\nHLSL30\tHLS\n")
+
+    monkeypatch.setattr(earthdata_dock, "https_only_urlopen", urlopen)
+    worker = CatalogLoadWorker(force_refresh=True, cache_dir=str(tmp_path))
+    worker.isInterruptionRequested = lambda: bool(interrupted)
+    emitted = []
+    worker.finished.connect(lambda *args: emitted.append(args))
+    worker.error.connect(emitted.append)
+
+    worker.run()
+
+    assert interrupted and emitted == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_data_search_worker_drops_result_when_interrupted(monkeypatch):
+    from nasa_earthdata.core import venv_manager
+
+    interrupted = []
+
+    def search_data(**kwargs):
+        interrupted.append(kwargs)
+        return ["granule"]
+
+    monkeypatch.setattr(
+        venv_manager,
+        "import_earthaccess",
+        lambda: SimpleNamespace(search_data=search_data),
+    )
+    worker = DataSearchWorker("HLSL30", None, None, None, 10)
+    worker.isInterruptionRequested = lambda: bool(interrupted)
+    worker._granules_to_gdf = lambda granules: pytest.fail("converted granules")
+    emitted = []
+    worker.finished.connect(lambda *args: emitted.append(args))
+    worker.error.connect(emitted.append)
+
+    worker.run()
+
+    assert interrupted and emitted == []
+
+
+def test_close_event_waits_on_workers_against_one_deadline(monkeypatch):
+    clock = [0.0]
+    log = []
+
+    class FakeWorker:
+        def __init__(self, name, stops):
+            self.name = name
+            self.stops = stops
+
+        def isRunning(self):
+            return True
+
+        def requestInterruption(self):
+            log.append(("interrupt", self.name))
+
+        def wait(self, ms):
+            log.append(("wait", self.name, ms))
+            if not self.stops:
+                clock[0] += ms / 1000
+            return self.stops
+
+        def terminate(self):
+            log.append(("terminate", self.name))
+
+    monkeypatch.setattr(
+        earthdata_dock, "time", SimpleNamespace(monotonic=lambda: clock[0])
+    )
+    dock = SimpleNamespace(
+        CLOSE_WAIT_MS=EarthdataDockWidget.CLOSE_WAIT_MS,
+        CLOSE_TERMINATE_WAIT_MS=EarthdataDockWidget.CLOSE_TERMINATE_WAIT_MS,
+        _finish_draw_bbox=lambda: None,
+        _catalog_worker=FakeWorker("catalog", stops=False),
+        _search_worker=FakeWorker("search", stops=False),
+        _download_worker=None,
+        _cog_worker=FakeWorker("cog", stops=True),
+    )
+    event = SimpleNamespace(accept=lambda: log.append(("accept",)))
+
+    EarthdataDockWidget.closeEvent(dock, event)
+
+    assert log[:3] == [
+        ("interrupt", "catalog"),
+        ("interrupt", "search"),
+        ("interrupt", "cog"),
+    ]
+    assert log[3:6] == [
+        ("wait", "catalog", EarthdataDockWidget.CLOSE_WAIT_MS),
+        ("wait", "search", 0),
+        ("wait", "cog", 0),
+    ]
+    assert ("terminate", "catalog") in log and ("terminate", "search") in log
+    assert ("terminate", "cog") not in log
+    assert log[-1] == ("accept",)
+    assert dock._cog_worker is None
+
+
+def test_reset_rebuilds_dataset_combo_only_when_items_changed():
+    class FakeCombo:
+        def __init__(self):
+            self.calls = []
+
+        def blockSignals(self, blocked):
+            self.calls.append(("blockSignals", blocked))
+
+        def setUpdatesEnabled(self, enabled):
+            self.calls.append(("setUpdatesEnabled", enabled))
+
+        def clear(self):
+            self.calls.append(("clear",))
+
+        def addItem(self, label, data):
+            self.calls.append(("addItem", label))
+
+        def currentIndex(self):
+            return 0
+
+    items = [{"label": "HLSL30"}, {"label": "HLSS30"}]
+    dock = MagicMock(
+        _nasa_data_names=items,
+        _dataset_combo_populated_hash=None,
+        _dataset_items_hash=EarthdataDockWidget._dataset_items_hash,
+    )
+    dock.dataset_combo = FakeCombo()
+    dock._populate_dataset_combo = lambda names: (
+        EarthdataDockWidget._populate_dataset_combo(dock, names)
+    )
+
+    EarthdataDockWidget._reset(dock)
+    assert dock.dataset_combo.calls == [
+        ("blockSignals", True),
+        ("setUpdatesEnabled", False),
+        ("clear",),
+        ("addItem", "HLSL30"),
+        ("addItem", "HLSS30"),
+        ("setUpdatesEnabled", True),
+        ("blockSignals", False),
+    ]
+
+    # The combo already shows the full catalog: no second rebuild.
+    dock.dataset_combo.calls.clear()
+    EarthdataDockWidget._reset(dock)
+    assert dock.dataset_combo.calls == []
+    assert dock._select_default_dataset.call_count == 2
+
+    # A filtered list in the combo is replaced on reset.
+    EarthdataDockWidget._populate_dataset_combo(dock, items[:1])
+    dock.dataset_combo.calls.clear()
+    EarthdataDockWidget._reset(dock)
+    assert ("addItem", "HLSS30") in dock.dataset_combo.calls
+
+
+def test_vsicurl_chunk_cache_is_bounded_and_cleared_on_close(monkeypatch):
+    import sys
+
+    from nasa_earthdata.dialogs.earthdata_dock import COGDisplayWorker
+
+    gdal = MagicMock()
+    osgeo = SimpleNamespace(gdal=gdal)
+    monkeypatch.setitem(sys.modules, "osgeo", osgeo)
+    monkeypatch.setitem(sys.modules, "osgeo.gdal", gdal)
+
+    COGDisplayWorker([])._configure_gdal_streaming(gdal, None)
+    gdal.SetConfigOption.assert_any_call("CPL_VSIL_CURL_CACHE_SIZE", "64000000")
+
+    dock = SimpleNamespace(
+        CLOSE_WAIT_MS=EarthdataDockWidget.CLOSE_WAIT_MS,
+        _finish_draw_bbox=lambda: None,
+        _catalog_worker=None,
+        _search_worker=None,
+        _download_worker=None,
+        _cog_worker=MagicMock(isRunning=MagicMock(return_value=False)),
+        _search_results=["granule"],
+    )
+    event = MagicMock()
+
+    EarthdataDockWidget.closeEvent(dock, event)
+
+    gdal.VSICurlClearCache.assert_called_once_with()
+    event.accept.assert_called_once_with()
+    assert dock._cog_worker is None
+    # Closing only hides the dock, so results stay for when it reopens.
+    assert dock._search_results == ["granule"]
+
+
+def test_download_finished_adds_only_raster_files(monkeypatch):
+    message_box = MagicMock()
+    message_box.question.return_value = message_box.StandardButton.Yes
+    raster_layer = MagicMock()
+    monkeypatch.setattr(earthdata_dock, "QMessageBox", message_box)
+    monkeypatch.setattr(earthdata_dock, "QgsRasterLayer", raster_layer)
+    monkeypatch.setattr(earthdata_dock, "QgsProject", MagicMock())
+    monkeypatch.setattr(earthdata_dock, "write_download_queue_state", MagicMock())
+    monkeypatch.setattr(earthdata_dock, "download_queue_state_path", MagicMock())
+    files = [
+        "/data/scene.TIF",
+        "/data/scene.tiff",
+        "/data/granule.nc",
+        "/data/granule.hdf",
+        "/data/readme.txt",
+        "/data/archive.tif.zip",
+        "/data/no_suffix",
+    ]
+
+    EarthdataDockWidget._on_download_finished(MagicMock(), files, "manifest", [])
+
+    assert [call.args[0] for call in raster_layer.call_args_list] == files[:4]
+
+
+def test_cog_layers_are_added_one_per_event_loop_turn(monkeypatch):
+    scheduled = []
+    project = MagicMock()
+    monkeypatch.setattr(
+        earthdata_dock,
+        "QTimer",
+        SimpleNamespace(singleShot=lambda ms, callback: scheduled.append(callback)),
+    )
+    monkeypatch.setattr(earthdata_dock, "QgsRasterLayer", MagicMock())
+    monkeypatch.setattr(earthdata_dock, "QgsProject", project)
+    dock = MagicMock(_pending_cog_layers=[("a", "/vsicurl/a"), ("b", "/vsicurl/b")])
+    dock._cog_added_count = 0
+    dock._load_next_cog_layer = lambda: EarthdataDockWidget._load_next_cog_layer(dock)
+    dock._finish_cog_loading = lambda: EarthdataDockWidget._finish_cog_loading(dock)
+
+    dock._load_next_cog_layer()
+    assert project.instance().addMapLayer.call_count == 1
+    assert len(scheduled) == 1
+    dock.display_btn.setEnabled.assert_not_called()
+
+    scheduled.pop()()
+    assert project.instance().addMapLayer.call_count == 2
+
+    scheduled.pop()()
+    assert scheduled == []
+    dock.display_btn.setEnabled.assert_called_once_with(True)
+    dock._notify_success.assert_called_once_with(
+        "NASA Earthdata", "Added 2 COG layer(s) to the map"
+    )
@@ -0,0 +1,220 @@
+"""Tests for the NASAEarthdata plugin class."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import nasa_earthdata
+from nasa_earthdata import nasa_earthdata as module
+from nasa_earthdata.nasa_earthdata import NASAEarthdata
+
+
+def test_add_action_reuses_cached_icon_per_path(monkeypatch):
+    created = []
+    monkeypatch.setattr(module, "QIcon", lambda path: created.append(path) or path)
+    monkeypatch.setattr(module, "QAction", MagicMock())
+    module._icon.cache_clear()
+    plugin = NASAEarthdata(MagicMock())
+    plugin.toolbar = MagicMock()
+    plugin.menu = MagicMock()
+
+    plugin.add_action(":/a.svg", "A", MagicMock())
+    plugin.add_action(":/a.svg", "A again", MagicMock())
+    plugin.add_action(":/b.svg", "B", MagicMock())
+    module._icon.cache_clear()
+
+    assert created == [":/a.svg", ":/b.svg"]
+
+
+def test_show_about_reads_metadata_version_once(monkeypatch, tmp_path):
+    # Without _version, show_about falls back to scanning metadata.txt.
+    monkeypatch.setitem(sys.modules, "nasa_earthdata._version", None)
+    (tmp_path / "metadata.txt").write_text(
+        "[general]\nname=NASA Earthdata\nversion=1.2.3\n", encoding="utf-8"
+    )
+    message_box = MagicMock()
+    monkeypatch.setattr(module, "QMessageBox", message_box)
+    monkeypatch.setattr(NASAEarthdata, "_about_html", None)
+    plugin = NASAEarthdata(MagicMock())
+    plugin._metadata_path = str(tmp_path / "metadata.txt")
+
+    plugin.show_about()
+    (tmp_path / "metadata.txt").unlink()
+    plugin.show_about()
+
+    assert message_box.about.call_count == 2
+    for call in message_box.about.call_args_list:
+        assert "Version: 1.2.3" in call.args[2]
+    message_box.warning.assert_not_called()
+
+
+def test_settings_dock_is_created_once_for_toggle_and_deps_tab(monkeypatch):
+    dock_cls = MagicMock()
+    monkeypatch.setitem(NASAEarthdata._dock_classes, "settings", dock_cls)
+    iface = MagicMock()
+    plugin = NASAEarthdata(iface)
+    plugin.settings_action = MagicMock()
+
+    plugin.toggle_settings_dock()
+    plugin._open_settings_deps_tab()
+
+    dock_cls.assert_called_once_with(iface, iface.mainWindow())
+    iface.addDockWidget.assert_called_once()
+    dock_cls.return_value.show_dependencies_tab.assert_called_once_with()
+    plugin.settings_action.setChecked.assert_called_once_with(True)
+
+
+def test_icon_paths_fall_back_to_theme_icons(tmp_path):
+    (tmp_path / "icons").mkdir()
+    (tmp_path / "icons" / "settings.svg").write_text("<svg/>", encoding="utf-8")
+    plugin = NASAEarthdata(MagicMock())
+    plugin._icons_dir = str(tmp_path / "icons")
+
+    icons = plugin._icon_paths()
+
+    assert icons["settings.svg"] == str(tmp_path / "icons" / "settings.svg")
+    assert icons["icon.svg"] == module.ICON_FALLBACKS["icon.svg"]
+
+    plugin._icons_dir = str(tmp_path / "missing")
+    assert plugin._icon_paths() == module.ICON_FALLBACKS
+
+
+def test_earthdata_dock_creation_failure_unchecks_action(monkeypatch):
+    message_box = MagicMock()
+    monkeypatch.setattr(module, "QMessageBox", message_box)
+    monkeypatch.setitem(
+        NASAEarthdata._dock_classes,
+        "earthdata",
+        MagicMock(side_effect=RuntimeError("x")),
+    )
+    plugin = NASAEarthdata(MagicMock())
+    plugin.earthdata_action = MagicMock()
+    plugin._check_dependencies_on_open = MagicMock()
+
+    plugin.toggle_earthdata_dock()
+
+    assert plugin._earthdata_dock is None
+    message_box.critical.assert_called_once()
+    plugin.earthdata_action.setChecked.assert_called_once_with(False)
+    plugin._check_dependencies_on_open.assert_not_called()
+
+
+def test_package_exposes_plugin_class_lazily():
+    assert nasa_earthdata.NASAEarthdata is NASAEarthdata
+    assert isinstance(nasa_earthdata.classFactory(MagicMock()), NASAEarthdata)
+
+
+def test_dependency_prompt_only_for_missing_packages(monkeypatch):
+    message_box = MagicMock()
+    message_box.warning.return_value = message_box.StandardButton.Yes
+    monkeypatch.setattr(module, "QMessageBox", message_box)
+    plugin = NASAEarthdata(MagicMock())
+    plugin._open_settings_deps_tab = MagicMock()
+    plugin._deps_check_worker = MagicMock()
+
+    plugin._on_dependencies_checked(True, [], [])
+    message_box.warning.assert_not_called()
+
+    plugin._on_dependencies_checked(False, [("earthaccess", "earthaccess")], [])
+    assert "earthaccess" in message_box.warning.call_args.args[2]
+    plugin._open_settings_deps_tab.assert_called_once_with()
+    # The worker is only released once its thread has finished.
+    assert plugin._deps_check_worker is not None
+
+
+def test_dependency_check_worker_is_released_after_thread_finishes(monkeypatch):
+    from qgis.PyQt.QtCore import QCoreApplication
+
+    from nasa_earthdata.core import venv_manager
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    monkeypatch.setattr(venv_manager, "check_dependencies", lambda: (True, [], []))
+    plugin = NASAEarthdata(MagicMock())
+    checked = []
+    plugin._on_dependencies_checked = lambda *args: checked.append(
+        plugin._deps_check_worker
+    )
+
+    plugin._check_dependencies_on_open()
+    worker = plugin._deps_check_worker
+    assert worker.wait(5000)
+    app.processEvents()
+
+    assert checked == [worker]
+    assert plugin._deps_check_worker is None
+    assert worker.isFinished()
+
+
+def test_unload_disconnects_dock_visibility_before_removal(monkeypatch):
+    iface = MagicMock()
+    plugin = NASAEarthdata(iface)
+    for key in NASAEarthdata.DOCKS:
+        monkeypatch.setitem(NASAEarthdata._dock_classes, key, MagicMock())
+        plugin._ensure_dock(key)
+    earthdata_dock = plugin._earthdata_dock
+    settings_dock = plugin._settings_dock
+    earthdata_slot = earthdata_dock.visibilityChanged.connect.call_args.args[0]
+    order = []
+    earthdata_dock.visibilityChanged.disconnect.side_effect = lambda slot: order.append(
+        "disconnect"
+    )
+    iface.removeDockWidget.side_effect = lambda dock: order.append("remove")
+
+    plugin.unload()
+
+    earthdata_dock.visibilityChanged.disconnect.assert_called_once_with(earthdata_slot)
+    settings_dock.visibilityChanged.disconnect.assert_called_once()
+    assert order[:2] == ["disconnect", "remove"]
+    assert plugin._earthdata_dock is None and plugin._settings_dock is None
+
+
+def test_dock_visibility_updates_matching_action(monkeypatch):
+    plugin = NASAEarthdata(MagicMock())
+    plugin.earthdata_action = MagicMock()
+    plugin.settings_action = MagicMock()
+    monkeypatch.setitem(NASAEarthdata._dock_classes, "settings", MagicMock())
+
+    dock = plugin._ensure_dock("settings")
+    dock.visibilityChanged.connect.call_args.args[0](False)
+
+    plugin.settings_action.setChecked.assert_called_once_with(False)
+    plugin.earthdata_action.setChecked.assert_not_called()
+
+
+def test_version_module_matches_metadata():
+    from nasa_earthdata._version import __version__
+
+    metadata = Path(__file__).parents[1] / "nasa_earthdata" / "metadata.txt"
+    lines = metadata.read_text(encoding="utf-8").splitlines()
+    assert f"version={__version__}" in lines
+
+
+def test_init_gui_adds_toolbar_and_menu_actions_in_batches(monkeypatch):
+    menu = MagicMock()
+    toolbar = MagicMock()
+    monkeypatch.setattr(module, "QMenu", MagicMock(return_value=menu))
+    monkeypatch.setattr(module, "QToolBar", MagicMock(return_value=toolbar))
+    monkeypatch.setattr(
+        module, "QAction", MagicMock(side_effect=lambda *a: MagicMock())
+    )
+    plugin = NASAEarthdata(MagicMock())
+    plugin._icon_paths = MagicMock(return_value=module.ICON_FALLBACKS)
+    plugin._remove_toolbars_by_object_name = MagicMock()
+    plugin._remove_menus_by_title = MagicMock()
+    plugin._register_processing_provider = MagicMock()
+
+    plugin.initGui()
+
+    toolbar.addAction.assert_not_called()
+    menu.addAction.assert_not_called()
+    toolbar.addActions.assert_called_once_with(
+        [plugin.earthdata_action, plugin.settings_action]
+    )
+    first, second = menu.addActions.call_args_list
+    assert first.args[0] == [
+        plugin.earthdata_action,
+        plugin.ai_chat_action,
+        plugin.settings_action,
+    ]
+    assert second.args[0] == plugin.actions[3:]
+    assert len(plugin.actions) == 5
@@ -0,0 +1,795 @@
+import pytest
+
+from nasa_earthdata.dialogs.settings_dock import CacheClearWorker, SettingsDockWidget
+
+
+class FakeSettings:
+    def __init__(self, values):
+        self.values = dict(values)
+        self.group = ""
+        self.reads = 0
+
+    def beginGroup(self, group):
+        self.group = group + "/"
+
+    def endGroup(self):
+        self.group = ""
+
+    def childKeys(self):
+        return [
+            key[len(self.group) :]
+            for key in self.values
+            if key.startswith(self.group) and "/" not in key[len(self.group) :]
+        ]
+
+    def value(self, key, default=None, type=None):
+        self.reads += 1
+        return self.values.get(self.group + key, default)
+
+    def setValue(self, key, value):
+        self.values[self.group + key] = value
+
+
+class FakeLabel:
+    """Label stand-in recording its text and last style state."""
+
+    def __init__(self):
+        self.text = ""
+        self.state = None
+        self.writes = 0
+
+    def setText(self, text):
+        self.text = text
+        self.writes += 1
+
+    def setStyleSheet(self, state):
+        self.state = state
+        self.writes += 1
+
+    def setEnabled(self, enabled):
+        pass
+
+
+class FakeTimer:
+    def __init__(self, active=False):
+        self.active = active
+
+    def isActive(self):
+        return self.active
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+
+class FakeField:
+    """Stand-in for a line edit, spin box, or check box."""
+
+    def __init__(self, value=None):
+        self.current = value
+
+    def setText(self, value):
+        self.current = value
+
+    setValue = setChecked = setText
+
+    def text(self):
+        return self.current
+
+    value = isChecked = text
+
+    def clear(self):
+        self.current = ""
+
+
+class StubDock(SettingsDockWidget):
+    """SettingsDockWidget with the Qt setup skipped, for testing its logic.
+
+    Styling goes through ``setStyleSheet(state)`` so fake labels record it.
+    """
+
+    def __init__(self, settings=None):
+        self.settings = settings if settings is not None else FakeSettings({})
+        self._dirty_keys = set()
+        self._unsaved_defaults = False
+
+    @staticmethod
+    def _set_state(widget, state, strong=False):
+        widget.setStyleSheet(state)
+
+
+@pytest.fixture
+def dock():
+    return StubDock()
+
+
+@pytest.fixture
+def netrc_path(tmp_path, monkeypatch):
+    path = tmp_path / ".netrc"
+    monkeypatch.setattr("nasa_earthdata.dialogs.settings_dock.NETRC_PATH", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _reset_class_caches():
+    SettingsDockWidget._netrc_cache = None
+    SettingsDockWidget._earthaccess = None
+    yield
+    SettingsDockWidget._netrc_cache = None
+    SettingsDockWidget._earthaccess = None
+
+
+def test_coerce_setting_handles_ini_strings():
+    coerce = SettingsDockWidget._coerce_setting
+
+    assert coerce("false", True) is False
+    assert coerce("true", False) is True
+    assert coerce("8", 4) == 8
+    assert coerce("not-a-number", 4) == 4
+    assert coerce(None, "default") == "default"
+
+
+def test_settings_reflect_values_written_by_other_modules(dock):
+    settings = dock.settings
+
+    assert dock._write_settings({"download_dir": "/A", "debug": True}) is True
+    # The search dock stores its own download directory.
+    settings.values["NASAEarthdata/download_dir"] = "/B"
+
+    assert dock._setting("download_dir", "") == "/B"
+    assert dock._read_settings() == {"download_dir": "/B", "debug": True}
+    assert dock._write_settings({"download_dir": "/A", "debug": True}) is True
+    assert settings.values["NASAEarthdata/download_dir"] == "/A"
+    assert dock._write_settings({"download_dir": "/A", "debug": True}) is False
+
+
+def test_read_settings_reads_only_direct_group_keys():
+    dock = StubDock(
+        FakeSettings(
+            {
+                "NASAEarthdata/download_threads": "8",
+                "NASAEarthdata/presets/name": "nested",
+                "Other/debug": "true",
+            }
+        )
+    )
+
+    assert dock._read_settings() == {"download_threads": "8"}
+
+
+def test_save_netrc_replaces_earthdata_entry_and_keeps_others(dock, netrc_path):
+    import netrc
+
+    netrc_path.write_text(
+        "machine example.com\n"
+        "    login alice\n"
+        "    password secret\n"
+        "machine urs.earthdata.nasa.gov\n"
+        "    login old\n"
+        "    password stale\n"
+        "default\n"
+        "    login anonymous\n"
+        "    password guest\n"
+    )
+
+    dock._save_netrc("new-user", "new-pass")
+
+    auths = netrc.netrc(str(netrc_path))
+    assert auths.authenticators("urs.earthdata.nasa.gov") == (
+        "new-user",
+        "",
+        "new-pass",
+    )
+    assert auths.authenticators("example.com") == ("alice", "", "secret")
+    assert auths.hosts["default"] == ("anonymous", "", "guest")
+    assert netrc_path.read_text().count("urs.earthdata.nasa.gov") == 1
+
+
+def test_save_netrc_creates_missing_file(dock, netrc_path):
+    import netrc
+
+    dock._save_netrc("user", "pass")
+
+    auths = netrc.netrc(str(netrc_path))
+    assert auths.authenticators("urs.earthdata.nasa.gov") == ("user", "", "pass")
+
+
+def test_cache_clear_worker_empties_directory_in_place(tmp_path):
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "nested").mkdir(parents=True)
+    (cache_dir / "catalog.tsv").write_text("data")
+    (cache_dir / "nested" / "thumb.png").write_bytes(b"png")
+    results = []
+
+    worker = CacheClearWorker(str(cache_dir))
+    worker.finished.connect(lambda ok, msg: results.append((ok, msg)))
+    worker.run()
+
+    assert results == [(True, "")]
+    assert cache_dir.is_dir()
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_save_netrc_leaves_no_temp_file_and_is_owner_only(dock, netrc_path):
+    import platform
+    import stat
+
+    dock._save_netrc("user", "pass")
+
+    assert [p.name for p in netrc_path.parent.iterdir()] == [".netrc"]
+    if platform.system() != "Windows":
+        mode = stat.S_IMODE(netrc_path.stat().st_mode)
+        assert mode == stat.S_IRUSR | stat.S_IWUSR
+
+
+def test_save_netrc_rewrites_file_the_parser_rejects(dock, netrc_path):
+    import netrc
+
+    netrc_path.write_text(
+        "machine example.com\n"
+        "    login alice\n"
+        "    password secret\n"
+        "    port 22\n"
+        "machine urs.earthdata.nasa.gov\n"
+        "    login old-user\n"
+        "    password old-pass\n"
+    )
+    with pytest.raises(netrc.NetrcParseError):
+        netrc.netrc(str(netrc_path))
+
+    dock._save_netrc("new-user", "new-pass")
+
+    content = netrc_path.read_text()
+    assert "    port 22" in content
+    assert "old-user" not in content and "old-pass" not in content
+    assert content.endswith(
+        "machine urs.earthdata.nasa.gov\n    login new-user\n    password new-pass\n"
+    )
+
+
+def test_save_netrc_keeps_symlinked_file_a_symlink(dock, netrc_path, tmp_path):
+    target = tmp_path / "dotfiles" / "netrc"
+    target.parent.mkdir()
+    target.write_text("machine example.com login alice password secret\n")
+    netrc_path.symlink_to(target)
+
+    dock._save_netrc("user", "pass")
+
+    assert netrc_path.is_symlink()
+    assert "login user" in target.read_text()
+    assert "example.com" in target.read_text()
+
+
+def test_settings_are_stored_per_key_only(dock):
+    dock.settings.values["NASAEarthdata/download_threads"] = "9"
+
+    assert dock._setting("download_threads", 4) == 9
+    dock._write_settings({"debug": True, "cache_dir": "/data"})
+
+    assert dock.settings.values == {
+        "NASAEarthdata/download_threads": "9",
+        "NASAEarthdata/debug": True,
+        "NASAEarthdata/cache_dir": "/data",
+    }
+
+
+def test_deps_status_skips_unchanged_label_writes(dock):
+    dock._deps_labels = {"earthaccess": FakeLabel(), "pystac": FakeLabel()}
+    dock._last_deps_state = {}
+    dock._last_install_btn_text = None
+    dock._deps_worker = None
+    dock.install_deps_btn = FakeLabel()
+
+    for _ in range(3):
+        dock._show_deps_status(False, [("pystac", ">=1")], [("earthaccess", "0.9")])
+
+    assert dock._deps_labels["earthaccess"].writes == 2
+    assert dock._deps_labels["pystac"].writes == 2
+    assert dock.install_deps_btn.writes == 1
+
+    dock._show_deps_status(True, [], [("earthaccess", "0.9"), ("pystac", "1.0")])
+
+    assert dock._deps_labels["earthaccess"].writes == 2
+    assert dock._deps_labels["pystac"].writes == 4
+    assert dock.install_deps_btn.writes == 2
+
+
+def test_defaults_are_read_only():
+    from nasa_earthdata.dialogs.settings_dock import DEFAULTS
+
+    with pytest.raises(TypeError):
+        DEFAULTS["download_threads"] = 8
+    assert DEFAULTS["catalog_url"].endswith("/nasa_earth_data.tsv")
+
+
+def test_deps_progress_is_coalesced_until_timer_flush(dock):
+    class FakeProgressWidget:
+        def __init__(self):
+            self.values = []
+
+        def setValue(self, value):
+            self.values.append(value)
+
+        def setText(self, text):
+            self.values.append(text)
+
+    dock._pending_progress = None
+    dock._progress_timer = FakeTimer()
+    dock.deps_progress_bar = FakeProgressWidget()
+    dock.deps_progress_label = FakeProgressWidget()
+
+    for percent in range(10, 60, 10):
+        dock._on_deps_progress(percent, f"step {percent}")
+
+    assert dock.deps_progress_bar.values == []
+    assert dock._progress_timer.isActive()
+
+    dock._flush_progress()
+    assert dock.deps_progress_bar.values == [50]
+    assert dock.deps_progress_label.values == ["step 50"]
+    assert dock._progress_timer.isActive()
+
+    dock._flush_progress()
+    assert dock.deps_progress_bar.values == [50]
+    assert not dock._progress_timer.isActive()
+
+
+def test_placeholder_tab_is_built_and_loaded_once(dock):
+    class FakeTabWidget:
+        def __init__(self, titles):
+            self.tabs = [(object(), title) for title in titles]
+            self.current = 0
+
+        def tabText(self, index):
+            return self.tabs[index][1]
+
+        def widget(self, index):
+            return None
+
+        def currentIndex(self):
+            return self.current
+
+        def setCurrentIndex(self, index):
+            self.current = index
+
+        def removeTab(self, index):
+            del self.tabs[index]
+
+        def insertTab(self, index, widget, title):
+            self.tabs.insert(index, (widget, title))
+
+        def blockSignals(self, block):
+            pass
+
+    calls = []
+    built = object()
+    dock._connect_auto_save = lambda index: calls.append("connect")
+    dock.tab_widget = FakeTabWidget(["Dependencies", "Credentials", "General"])
+    dock.tab_widget.current = SettingsDockWidget.GENERAL_TAB
+    dock._tab_builders = {
+        SettingsDockWidget.GENERAL_TAB: (
+            lambda: calls.append("build") or built,
+            lambda: calls.append("load"),
+        )
+    }
+
+    assert not dock._is_tab_built(SettingsDockWidget.GENERAL_TAB)
+    dock._materialize_tab(SettingsDockWidget.GENERAL_TAB)
+    dock._materialize_tab(SettingsDockWidget.GENERAL_TAB)
+
+    assert calls == ["build", "load", "connect"]
+    assert dock._is_tab_built(SettingsDockWidget.GENERAL_TAB)
+    assert dock.tab_widget.tabs[2] == (built, "General")
+    assert dock.tab_widget.currentIndex() == SettingsDockWidget.GENERAL_TAB
+
+
+def test_netrc_is_parsed_once_until_the_file_changes(dock, netrc_path, monkeypatch):
+    import netrc
+
+    dock._save_netrc("user", "pass")
+
+    parses = []
+    real_netrc = netrc.netrc
+
+    def counting_netrc(*args):
+        parses.append(args)
+        return real_netrc(*args)
+
+    monkeypatch.setattr(
+        "nasa_earthdata.dialogs.settings_dock.netrc.netrc", counting_netrc
+    )
+
+    assert dock._get_netrc_earthdata_credentials() == ("user", "pass")
+    assert dock._load_netrc() is dock._load_netrc()
+    assert parses == []
+
+    netrc_path.write_text("machine urs.earthdata.nasa.gov login other password pw\n")
+    assert dock._get_netrc_earthdata_credentials() == ("other", "pw")
+    assert len(parses) == 1
+
+
+def test_credentials_test_worker_leaves_env_and_netrc_alone(monkeypatch, netrc_path):
+    import base64
+    import os
+    import urllib.error
+
+    from nasa_earthdata.dialogs.settings_dock import (
+        EARTHDATA_TOKENS_URL,
+        CredentialsTestWorker,
+    )
+
+    requests = []
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    def urlopen(url, timeout, headers):
+        requests.append((url, headers["Authorization"]))
+        user = base64.b64decode(headers["Authorization"].split()[1]).decode()
+        if user.startswith("bad:"):
+            raise urllib.error.HTTPError(url, 401, "Unauthorized", {}, None)
+        if user.startswith("down:"):
+            raise urllib.error.HTTPError(url, 503, "Unavailable", {}, None)
+        return FakeResponse()
+
+    monkeypatch.setattr(
+        "nasa_earthdata.dialogs.settings_dock.https_only_urlopen", urlopen
+    )
+    monkeypatch.setenv("EARTHDATA_USERNAME", "previous")
+    monkeypatch.setenv("EARTHDATA_PASSWORD", "previous-pw")
+    results = []
+
+    for username in ("bad", "down", "good"):
+        worker = CredentialsTestWorker(username, "pw")
+        worker.finished.connect(lambda ok, msg: results.append((ok, msg)))
+        worker.run()
+
+    assert results == [
+        (False, "✗ Authentication failed"),
+        (False, "Error: HTTP 503"),
+        (True, ""),
+    ]
+    assert requests[-1] == (
+        EARTHDATA_TOKENS_URL,
+        "Basic " + base64.b64encode(b"good:pw").decode(),
+    )
+    assert os.environ["EARTHDATA_USERNAME"] == "previous"
+    assert os.environ["EARTHDATA_PASSWORD"] == "previous-pw"
+    assert not netrc_path.exists()
+
+
+def test_tested_credentials_are_exported_and_saved_on_gui_thread(
+    dock, monkeypatch, netrc_path
+):
+    import os
+
+    monkeypatch.setenv("EARTHDATA_USERNAME", "previous")
+    monkeypatch.setenv("EARTHDATA_PASSWORD", "previous-pw")
+    dock.test_creds_btn = FakeLabel()
+    dock.creds_status_label = FakeLabel()
+    dock.netrc_status_label = FakeLabel()
+    dock._creds_test_worker = type("Worker", (), {"username": "u", "password": "p"})
+
+    dock._on_credentials_tested(False, "✗ Authentication failed")
+    assert os.environ["EARTHDATA_USERNAME"] == "previous"
+    assert not netrc_path.exists()
+
+    dock._on_credentials_tested(True, "")
+    assert os.environ["EARTHDATA_USERNAME"] == "u"
+    assert os.environ["EARTHDATA_PASSWORD"] == "p"
+    assert dock._get_netrc_earthdata_credentials() == ("u", "p")
+    assert dock.creds_status_label.text == "✓ Credentials valid! Saved to .netrc"
+
+
+def test_earthaccess_import_is_memoized(monkeypatch):
+    from nasa_earthdata.dialogs.settings_dock import EarthaccessWarmupWorker
+
+    module = object()
+    imports = []
+    monkeypatch.setattr(
+        "nasa_earthdata.dialogs.settings_dock.import_earthaccess",
+        lambda: imports.append(1) or module,
+    )
+
+    EarthaccessWarmupWorker().run()
+
+    assert SettingsDockWidget._ensure_earthaccess() is module
+    assert imports == [1]
+
+
+def test_check_netrc_reports_missing_file(dock, netrc_path):
+    dock.netrc_status_label = FakeLabel()
+
+    dock._check_netrc()
+    assert dock.netrc_status_label.text == "✗ .netrc file not found"
+
+    dock._save_netrc("user", "pass")
+    dock._check_netrc()
+    assert dock.netrc_status_label.text == "✓ Found Earthdata credentials for: user"
+
+
+def test_failed_netrc_write_drops_cached_parse(dock, netrc_path, monkeypatch):
+    dock._save_netrc("user", "pass")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("nasa_earthdata.dialogs.settings_dock.os.replace", fail_replace)
+        with pytest.raises(Exception, match="Failed to save .netrc"):
+            dock._save_netrc("other", "pw")
+
+    auths = dock._load_netrc()
+    assert auths.authenticators("urs.earthdata.nasa.gov") == ("user", "", "pass")
+    assert [p.name for p in netrc_path.parent.iterdir()] == [".netrc"]
+
+
+def test_fast_clear_keeps_going_past_failed_entries(tmp_path, monkeypatch):
+    import os
+
+    from nasa_earthdata.dialogs import settings_dock
+
+    for name in ("a.tsv", "locked.tsv", "z.tsv"):
+        (tmp_path / name).write_text("data")
+    real_unlink = os.unlink
+
+    def unlink(path):
+        if path.endswith("locked.tsv"):
+            raise PermissionError(13, "Permission denied", path)
+        real_unlink(path)
+
+    monkeypatch.setattr(settings_dock.os, "unlink", unlink)
+
+    errors = settings_dock._fast_clear(str(tmp_path))
+
+    assert errors == ["locked.tsv: Permission denied"]
+    assert [p.name for p in tmp_path.iterdir()] == ["locked.tsv"]
+
+
+def test_auto_save_flush_writes_only_edited_general_and_advanced_values(dock):
+    dock._field_values = lambda index: {"download_threads": 6, "auto_zoom": False}
+    dock._save_timer = FakeTimer(active=True)
+    dock._dirty_keys = {"download_threads", "username"}
+    dock.status_label = FakeLabel()
+    dock._tab_builders = {
+        SettingsDockWidget.CREDENTIALS_TAB: None,
+        SettingsDockWidget.ADVANCED_TAB: None,
+    }
+
+    dock._flush_to_qsettings()
+
+    assert not dock._save_timer.isActive()
+    assert dock.settings.values["NASAEarthdata/download_threads"] == 6
+    assert "NASAEarthdata/auto_zoom" not in dock.settings.values
+    assert "NASAEarthdata/username" not in dock.settings.values
+    assert dock.status_label.text == "Settings saved"
+    assert dock._dirty_keys == set()
+
+    dock.status_label.text = ""
+    dock._flush_to_qsettings()
+    assert dock.status_label.text == ""
+
+
+@pytest.fixture
+def reset_dock(dock, monkeypatch):
+    """A dock with stored General/Advanced values, ready for Reset Defaults."""
+    from unittest.mock import MagicMock
+
+    from nasa_earthdata.dialogs import settings_dock
+
+    message_box = MagicMock()
+    message_box.question.return_value = message_box.StandardButton.Yes
+    monkeypatch.setattr(settings_dock, "QMessageBox", message_box)
+    stored = {"download_threads": 8, "auto_zoom": False, "catalog_url": "https://x"}
+    dock.settings.values.update(
+        {f"NASAEarthdata/{key}": value for key, value in stored.items()}
+    )
+    for fields in SettingsDockWidget.SETTINGS_FIELDS.values():
+        for key, attr, _kind in fields:
+            setattr(dock, attr, FakeField(stored.get(key)))
+    dock.username_input = FakeField()
+    dock.password_input = FakeField()
+    dock.status_label = FakeLabel()
+    dock._save_timer = FakeTimer()
+    dock._build_all_tabs = lambda: None
+    dock._tab_builders = {}
+    return dock
+
+
+def test_edit_after_reset_defaults_saves_only_the_edited_field(reset_dock):
+    dock = reset_dock
+    dock._reset_defaults()
+    assert dock.status_label.text == "Defaults restored (not saved)"
+
+    dock.download_threads_spin.setValue(2)
+    dock._schedule_save("download_threads")
+    dock._flush_to_qsettings()
+
+    assert dock.settings.values["NASAEarthdata/download_threads"] == 2
+    assert dock.settings.values["NASAEarthdata/auto_zoom"] is False
+    assert dock.settings.values["NASAEarthdata/catalog_url"] == "https://x"
+
+
+def test_reshow_after_reset_defaults_keeps_unsaved_defaults(reset_dock, monkeypatch):
+    from unittest.mock import MagicMock
+
+    from qgis.PyQt.QtWidgets import QDockWidget
+
+    dock = reset_dock
+    monkeypatch.setattr(QDockWidget, "showEvent", lambda self, event: None)
+    dock.iface = MagicMock()
+    dock._check_netrc = lambda: None
+
+    dock._reset_defaults()
+    dock.showEvent(None)
+
+    assert dock.download_threads_spin.value() == 4
+    assert dock.status_label.text == "Defaults restored (not saved)"
+
+    # Once saved, re-showing reloads from QSettings again.
+    dock._save_settings()
+    dock.settings.values["NASAEarthdata/download_threads"] = 9
+    dock.showEvent(None)
+    assert dock.download_threads_spin.value() == 9
+
+
+def test_dock_stylesheet_is_built_once_per_theme(dock):
+    dock._uses_dark_palette = lambda: False
+    SettingsDockWidget._dock_stylesheet_cache.clear()
+
+    sheet = dock._dock_stylesheet()
+
+    assert dock._dock_stylesheet() is sheet
+    assert 'QLabel[state="success"] { color: #1b5e20; }' in sheet
+    assert 'QPushButton[role="primary"]' in sheet
+
+
+def test_palette_change_switches_dock_stylesheet(dock, monkeypatch):
+    from qgis.PyQt.QtCore import QEvent
+    from qgis.PyQt.QtWidgets import QDockWidget
+
+    monkeypatch.setattr(QDockWidget, "changeEvent", lambda self, event: None)
+    SettingsDockWidget._dock_stylesheet_cache.clear()
+    dark = [False]
+    applied = []
+    dock._uses_dark_palette = lambda: dark[0]
+    dock.styleSheet = lambda: applied[-1] if applied else ""
+    dock.setStyleSheet = applied.append
+    dock.setStyleSheet(dock._dock_stylesheet())
+
+    dock.changeEvent(QEvent(QEvent.Type.PaletteChange))
+    assert len(applied) == 1
+
+    dark[0] = True
+    dock.changeEvent(QEvent(QEvent.Type.FontChange))
+    assert len(applied) == 1
+    dock.changeEvent(QEvent(QEvent.Type.PaletteChange))
+    assert len(applied) == 2
+    assert 'QLabel[state="success"] { color: #7ee2a8; }' in applied[-1]
+
+
+def test_set_state_repolishes_only_on_change():
+    class FakeStyle:
+        polished = 0
+
+        def unpolish(self, widget):
+            pass
+
+        def polish(self, widget):
+            self.polished += 1
+
+    class FakeStyledLabel:
+        def __init__(self):
+            self.props = {}
+            self._style = FakeStyle()
+
+        def property(self, name):
+            return self.props.get(name)
+
+        def setProperty(self, name, value):
+            self.props[name] = value
+
+        def style(self):
+            return self._style
+
+    label = FakeStyledLabel()
+    SettingsDockWidget._set_state(label, "error")
+    SettingsDockWidget._set_state(label, "error")
+    SettingsDockWidget._set_state(label, "success", strong=True)
+
+    assert label.props == {"state": "success", "strong": True}
+    assert label.style().polished == 2
+
+
+def test_settings_fields_round_trip_through_widgets():
+    dock = StubDock(
+        FakeSettings(
+            {"NASAEarthdata/download_threads": "8", "NASAEarthdata/download_dir": "/d"}
+        )
+    )
+    for _key, attr, _kind in SettingsDockWidget.SETTINGS_FIELDS[
+        SettingsDockWidget.GENERAL_TAB
+    ]:
+        setattr(dock, attr, FakeField())
+
+    dock._load_fields(SettingsDockWidget.GENERAL_TAB)
+
+    assert dock._field_values(SettingsDockWidget.GENERAL_TAB) == {
+        "download_dir": "/d",
+        "download_threads": 8,
+        "default_max_items": 50,
+        "auto_zoom": True,
+        "notifications": True,
+    }
+
+
+def test_save_reports_credentials_only_change(dock, netrc_path, monkeypatch):
+    from unittest.mock import MagicMock
+
+    class FakeLineEdit:
+        def __init__(self, value):
+            self.value = value
+
+        def text(self):
+            return self.value
+
+    monkeypatch.setenv("EARTHDATA_USERNAME", "")
+    monkeypatch.setenv("EARTHDATA_PASSWORD", "")
+    dock.settings.values["NASAEarthdata/username"] = "user"
+    dock.iface = MagicMock()
+    dock._tab_builders = {}
+    dock._field_values = lambda index: {}
+    dock._save_timer = FakeTimer()
+    dock.username_input = FakeLineEdit("user")
+    dock.password_input = FakeLineEdit("new-pass")
+    for name in ("creds_status_label", "netrc_status_label", "status_label"):
+        setattr(dock, name, FakeLabel())
+
+    dock._save_settings()
+
+    assert dock.status_label.text == "Settings saved"
+    dock.iface.messageBar().pushSuccess.assert_called_once()
+    assert dock._load_netrc().authenticators("urs.earthdata.nasa.gov") == (
+        "user",
+        "",
+        "new-pass",
+    )
+
+    dock.password_input.value = ""
+    dock._save_settings()
+    assert dock.status_label.text == "No changes to save"
+
+
+def test_deps_check_failure_is_not_reported_as_missing_packages(dock, monkeypatch):
+    from nasa_earthdata.core import venv_manager
+    from nasa_earthdata.dialogs.deps_manager import DepsCheckWorker
+
+    def broken_check():
+        raise OSError("venv unreadable")
+
+    monkeypatch.setattr(venv_manager, "check_dependencies", broken_check)
+    results, failures = [], []
+    worker = DepsCheckWorker()
+    worker.result.connect(lambda *args: results.append(args))
+    worker.failed.connect(failures.append)
+    worker.run()
+
+    assert results == []
+    assert failures == ["venv unreadable"]
+
+    dock.deps_progress_label = FakeLabel()
+    dock.deps_progress_label.setVisible = lambda visible: None
+    dock._deps_labels = {"earthaccess": FakeLabel()}
+    dock._last_deps_state = {}
+    dock._deps_refresh_pending = False
+
+    dock._on_deps_check_failed(failures[0])
+
+    assert dock._deps_labels["earthaccess"].text == "Check failed"
+    assert "venv unreadable" in dock.deps_progress_label.text